@@ -0,0 +1,137 @@
+import gc
+import subprocess
+import time
+import warnings
+
+from llvmlite import ir
+
+from compiler.codegen import CodeGen
+from compiler.lexer import Lexer
+from compiler.parser import Parser, ParserState
+from rply.token import TokenBuffer
+
+# The example program from input.code with every top-level name suffixed,
+# so that copies of it can be concatenated into one valid program.
+SAMPLE = """
+def int qqq_N(int a, int b) {
+
+    while (a != b){
+        if (a > b) {
+            a = sub(a, b);
+        }
+        else {
+            b = sub(b, a);
+        }
+    }
+
+    return(a);
+}
+
+def int factor_N(int a) {
+    int res = 0;
+    if (a == 1 or a == 0) {
+        res = a;
+    }
+    else {
+        res = factor_N(a - 1) * a;
+    }
+    return(res);
+}
+
+def int floor_N(float a) {
+    int res = 0;
+    float ptr = 0.0;
+    while (ptr <= a) {
+        res = res + 1;
+        ptr = ptr + 1.0;
+    }
+    return(sub(res, 1));
+}
+
+int q_N = qqq_N(10, 15);
+print(q_N);
+q_N = qqq_N(8, 4);
+print(q_N);
+
+int a_N = 0;
+while (a_N <= 10) {
+    print(factor_N(a_N));
+    a_N = a_N + 1;
+}
+//print(factor_N(5));
+print(floor_N(5.9));
+print(-5);
+"""
+
+
+def generate(copies):
+    return "".join(SAMPLE.replace("_N", "_%d" % i) for i in range(copies))
+
+
+def timed(func, *args, repeat=3):
+    best = None
+    result = None
+    for _ in range(repeat):
+        result = None
+        gc.collect()
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+
+def run_best(exe, repeat=3):
+    """Best wall time of `repeat` runs of the executable `exe`, and its output"""
+    best = None
+    output = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = subprocess.run([exe], capture_output=True, text=True).stdout.strip()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, output
+
+
+def build_parser():
+    """The compiler's productions and the parser built from them"""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        productions = Parser(None, None, None)
+        parser = productions.build()
+    return productions, parser
+
+
+def parse(productions, parser, tokens, codegen=None):
+    """
+    Parses `tokens` with a parser from build_parser() into the module of
+    `codegen`. Main() declares globals, so without a CodeGen every parse
+    gets a module of its own. Returns the tree and its ParserState.
+    """
+    if codegen is None:
+        productions.module = ir.Module()
+    else:
+        productions.module = codegen.module
+        productions.builder = codegen.builder
+        productions.printf = codegen.printf
+    state = ParserState()
+    return parser.parse(tokens, state=state), state
+
+
+def compile_program(source, opt_level=0, parser=None, fold=True, **options):
+    """
+    Compiles `source` as main.py does: lexes, parses, analyzes, folds
+    unless `fold` is false, and evaluates it into a CodeGen(opt_level,
+    **options), then runs create_ir(). `parser` is a (productions, parser) pair from
+    build_parser(), built for the call if not given. Returns the CodeGen.
+    """
+    productions, parser = parser or build_parser()
+    codegen = CodeGen(opt_level=opt_level, **options)
+    tree, state = parse(productions, parser, TokenBuffer(Lexer().build().lex(source)), codegen)
+    tree.analyze(state)
+    if fold:
+        tree.fold()
+    tree.eval(None)
+    codegen.create_ir()
+    return codegen
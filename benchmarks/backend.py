@@ -0,0 +1,33 @@
+"""
+Per-phase time of the LLVM side of the compiler for copies of the sample
+program, writing the module as LLVM IR and as bitcode.
+
+    python -m benchmarks.backend [copies]
+"""
+import os
+import sys
+import tempfile
+
+from benchmarks import build_parser, compile_program, generate
+from compiler.codegen import CodeGen
+
+
+def backend(source, parser, save, filename):
+    """Compiles `source`, then writes it with the CodeGen method `save`"""
+    codegen = compile_program(source, parser=parser)
+    save(codegen, filename)
+    return codegen.timings, os.path.getsize(filename)
+
+
+def main(copies=200):
+    source = generate(copies)
+    parser = build_parser()
+    with tempfile.TemporaryDirectory() as tmp:
+        for save, name in ((CodeGen.save_ir, "output.ll"), (CodeGen.save_bitcode, "output.bc")):
+            timings, size = backend(source, parser, save, os.path.join(tmp, name))
+            print("%s (%d bytes): %s" % (name, size, "  ".join(
+                "%s %.3fs" % item for item in timings.items())))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
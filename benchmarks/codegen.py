@@ -0,0 +1,49 @@
+"""
+Code generation time with and without the debug tree that main.py writes
+for treant-js with --tree, and the number of tree nodes allocated.
+
+    python -m benchmarks.codegen [copies]
+"""
+import sys
+
+from benchmarks import build_parser, generate, parse, timed
+from compiler import AbstractSyntaxTree
+from compiler.codegen import CodeGen
+from compiler.JSONparsedTree import Node
+from compiler.lexer import Lexer
+from rply.token import TokenBuffer
+
+
+class CountingNode(Node):
+    count = 0
+
+    def __init__(self, arg_name, arg_children=None):
+        CountingNode.count += 1
+        Node.__init__(self, arg_name, arg_children)
+
+
+def run(productions, parser, tokens, root):
+    tree, state = parse(productions, parser, tokens, CodeGen())
+    tree.analyze(state)
+    return timed(tree.eval, root, repeat=1)[0]
+
+
+def main(copies=100):
+    tokens = TokenBuffer(Lexer().build().lex(generate(copies)))
+    productions, parser = build_parser()
+    AbstractSyntaxTree.Node = CountingNode
+    try:
+        for name, make_root in [("no tree", lambda: None),
+                                ("tree", lambda: CountingNode("main"))]:
+            best = None
+            for _ in range(3):
+                CountingNode.count = 0
+                elapsed = run(productions, parser, tokens, make_root())
+                best = elapsed if best is None else min(best, elapsed)
+            print("%-7s %8.3fs %9d nodes" % (name, best, CountingNode.count))
+    finally:
+        AbstractSyntaxTree.Node = Node
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,52 @@
+"""
+Time from a parsed program to an executable: writing output.ll and
+building it with llc and cc as llvm_to_asm.bash does, against emitting
+the object code in-process and calling cc once. Also checks that the
+emitted assembly uses the small code model, as llc does: calls and GOT
+loads without 64-bit movabs immediates. Needs llc and cc.
+
+    python -m benchmarks.emit [copies]
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from benchmarks import compile_program, generate, timed
+
+
+def llc_pipeline(codegen, tmp, cc):
+    ll = os.path.join(tmp, "old.ll")
+    obj = os.path.join(tmp, "old.o")
+    exe = os.path.join(tmp, "old")
+    codegen.save_ir(ll)
+    subprocess.check_call(["llc", "-filetype=obj", "-relocation-model=pic", ll, "-o", obj])
+    subprocess.check_call([cc, obj, "-o", exe])
+    return exe
+
+
+def in_process(codegen, tmp, cc):
+    exe = os.path.join(tmp, "new")
+    codegen.emit_executable(exe, linker=cc)
+    return exe
+
+
+def main(copies=1):
+    cc = shutil.which("cc") or shutil.which("gcc")
+    codegen = compile_program(generate(copies))
+    with tempfile.TemporaryDirectory() as tmp:
+        outputs = []
+        for name, pipeline in (("llc + cc", llc_pipeline), ("emit_object + cc", in_process)):
+            elapsed, exe = timed(pipeline, codegen, tmp, cc, repeat=5)
+            outputs.append(subprocess.run([exe], capture_output=True, text=True).stdout)
+            print("%-16s %7.3fs" % (name, elapsed))
+        print("same output:", outputs[0] == outputs[1])
+        asm = os.path.join(tmp, "new.s")
+        codegen.emit_assembly(asm)
+        with open(asm) as f:
+            print("no movabs:", not any("movabs" in line for line in f))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,48 @@
+"""
+IR size and LLVM time (parsing, verification and emitting an object file)
+with and without folding constants on the AST, for the sample program and
+for one made of constant-heavy expressions.
+
+    python -m benchmarks.fold [copies]
+"""
+import sys
+
+from llvmlite import binding
+
+from benchmarks import build_parser, compile_program, generate, timed
+from compiler.codegen import CodeGen
+
+CONSTANTS = """
+int c_N = 7;
+float f_N = 2.5;
+print(c_N * (4 - 3) + (10 - 10) * c_N);
+print(-(-c_N) + 60 * 60 * 24 / 1000);
+print((2 + 3 > 4) and not (1 == 2));
+print(sum(c_N, 0) - 0 + sub(100, 1) / 1);
+f_N = f_N * 1.0 - 0.0 + 3.0 * 0.5;
+"""
+
+
+def llvm(llvm_ir, target_machine):
+    mod = binding.parse_assembly(llvm_ir)
+    mod.verify()
+    return target_machine.emit_object(mod)
+
+
+def main(copies=100):
+    parser = build_parser()
+    CodeGen()
+    target_machine = binding.Target.from_default_triple().create_target_machine()
+    sources = [("sample", generate(copies)),
+               ("constants", "".join(CONSTANTS.replace("_N", "_%d" % i) for i in range(copies)))]
+    for name, source in sources:
+        for fold in (False, True):
+            llvm_ir = compile_program(source, parser=parser, fold=fold).llvm_ir
+            instructions = sum(1 for line in llvm_ir.splitlines() if line.startswith("  "))
+            elapsed, _ = timed(llvm, llvm_ir, target_machine)
+            print("%-9s %-7s %8d instructions %8.3fs" % (
+                name, "fold" if fold else "no fold", instructions, elapsed))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
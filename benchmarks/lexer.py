@@ -0,0 +1,30 @@
+"""
+Tokens per second of the rule-by-rule lexer against the master-pattern one.
+
+    python -m benchmarks.lexer [copies]
+"""
+import sys
+
+from benchmarks import generate, timed
+from compiler.lexer import Lexer
+
+
+def count_tokens(lexer, source):
+    n = 0
+    for _ in lexer.lex(source):
+        n += 1
+    return n
+
+
+def main(copies=2000):
+    source = generate(copies)
+    generator = Lexer().lexer
+    print("%d bytes" % len(source))
+    for name, lexer in [("rules", generator.build()),
+                        ("master", generator.build(master=True))]:
+        elapsed, n = timed(count_tokens, lexer, source)
+        print("%-8s %9d tokens %8.3fs %12.0f tokens/s" % (name, n, elapsed, n / elapsed))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
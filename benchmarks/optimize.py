@@ -0,0 +1,84 @@
+"""
+Compile time, IR size and run time of the generated code at each
+optimization level, for the functions of input.code driven by a loop.
+Needs a C compiler (cc) to link the executables.
+
+    python -m benchmarks.optimize [iterations]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import warnings
+
+from benchmarks import compile_program, run_best, timed
+
+WORKLOAD = """
+def int qqq(int a, int b) {
+    while (a != b) {
+        if (a > b) {
+            a = sub(a, b);
+        }
+        else {
+            b = sub(b, a);
+        }
+    }
+    return(a);
+}
+
+def int factor(int a) {
+    int res = 0;
+    if (a == 1 or a == 0) {
+        res = a;
+    }
+    else {
+        res = factor(a - 1) * a;
+    }
+    return(res);
+}
+
+def int floor(float a) {
+    int res = 0;
+    float ptr = 0.0;
+    while (ptr <= a) {
+        res = res + 1;
+        ptr = ptr + 1.0;
+    }
+    return(sub(res, 1));
+}
+
+int i = 0;
+int acc = 0;
+float x = 0.5;
+while (i < ITERATIONS) {
+    acc = acc + qqq(i + 1, 360) + factor(i - i / 12 * 12) + floor(x);
+    x = x + 0.25;
+    if (x > 100.0) {
+        x = 0.5;
+    }
+    i = i + 1;
+}
+print(acc);
+"""
+
+
+def main(iterations=200000):
+    source = WORKLOAD.replace("ITERATIONS", str(iterations))
+    cc = shutil.which("cc") or shutil.which("gcc")
+    warnings.simplefilter("ignore")
+    with tempfile.TemporaryDirectory() as tmp:
+        for opt_level in range(4):
+            elapsed, codegen = timed(compile_program, source, opt_level)
+            ll = os.path.join(tmp, "O%d.ll" % opt_level)
+            codegen.save_ir(ll)
+            with open(ll) as f:
+                instructions = sum(1 for line in f if line.startswith("  "))
+            exe = os.path.join(tmp, "O%d" % opt_level)
+            codegen.emit_executable(exe, linker=cc)
+            best, output = run_best(exe)
+            print("-O%d compile %6.3fs %5d instructions run %7.3fs  output %s" % (
+                opt_level, elapsed, instructions, best, output))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,47 @@
+"""
+Parse throughput of the dictionary-driven LRParser against DenseLRParser,
+on a token list and on a TokenBuffer. The "loop" rows use productions that
+do nothing, so they measure the parser alone; the "ast" rows build the
+compiler's syntax tree.
+
+    python -m benchmarks.parser [copies]
+"""
+import sys
+import warnings
+
+from benchmarks import generate, parse, timed
+from compiler.lexer import Lexer
+from compiler.parser import Parser
+from rply import ParserGenerator
+from rply.token import TokenBuffer
+
+
+def noop(state, p):
+    return None
+
+
+def main(copies=1000):
+    source = generate(copies)
+    lexer = Lexer().build()
+    inputs = [("list", list(lexer.lex(source))),
+              ("buffer", TokenBuffer(lexer.lex(source)))]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        productions = Parser(None, None, None)
+        pg = productions.pg
+        loop = ParserGenerator(pg.tokens, precedence=pg.precedence)
+        for name, syms, func, precedence in pg.productions:
+            loop.productions.append((name, syms, noop, precedence))
+        parsers = [("loop", "dict", loop.build()),
+                   ("loop", "dense", loop.build(dense=True)),
+                   ("ast", "dict", pg.build()),
+                   ("ast", "dense", pg.build(dense=True))]
+    for mode, name, parser in parsers:
+        for input_name, tokens in inputs:
+            elapsed, _ = timed(parse, productions, parser, tokens)
+            print("%-4s %-6s %-7s %9d tokens %8.3fs %12.0f tokens/s" % (
+                mode, name, input_name, len(tokens), elapsed, len(tokens) / elapsed))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
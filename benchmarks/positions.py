@@ -0,0 +1,39 @@
+"""
+Lexing speed on a single-line source of growing size. Tokens/s should stay
+flat: computing a token's column must not depend on how far it is from the
+previous newline.
+
+    python -m benchmarks.positions [megabytes]
+"""
+import sys
+
+from benchmarks import SAMPLE, timed
+from compiler.lexer import Lexer
+
+
+def one_line(size):
+    lines = [line for line in SAMPLE.splitlines() if not line.startswith("//")]
+    chunk = " ".join(lines)
+    copies = size // len(chunk) + 1
+    return " ".join(chunk.replace("_N", "_%d" % i) for i in range(copies))
+
+
+def lex(lexer, source):
+    n = 0
+    for token in lexer.lex(source):
+        n += 1
+    assert token.getsourcepos().lineno == 1
+    return n
+
+
+def main(megabytes=10):
+    lexer = Lexer().build()
+    for size in sorted({1, megabytes // 4 or 1, megabytes // 2 or 1, megabytes}):
+        source = one_line(size * 1024 * 1024)
+        elapsed, n = timed(lex, lexer, source, repeat=1)
+        print("%6.2f MB %9d tokens %8.3fs %12.0f tokens/s" % (
+            len(source) / 1024.0 / 1024, n, elapsed, n / elapsed))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,37 @@
+"""
+Time to build the compiler's parser without a table cache, with an empty
+cache (cold), with the tables already cached (warm) and from the tables
+generated ahead of time in compiler/parsetab.py.
+
+    python -m benchmarks.startup
+"""
+import tempfile
+import warnings
+
+from benchmarks import timed
+from compiler import parsetab
+from compiler.parser import Parser
+
+
+def build(cache_dir, tables=None):
+    parser = Parser(None, None, None, cache_dir=cache_dir)
+    if cache_dir is None:
+        parser.pg.cache_id = None
+    return parser.pg.build(dense=True, tables=tables)
+
+
+def main():
+    warnings.simplefilter("ignore")
+    elapsed, _ = timed(build, None)
+    print("no cache %8.1f ms" % (elapsed * 1000))
+    with tempfile.TemporaryDirectory() as cache_dir:
+        elapsed, _ = timed(build, cache_dir, repeat=1)
+        print("cold     %8.1f ms" % (elapsed * 1000))
+        elapsed, _ = timed(build, cache_dir)
+        print("warm     %8.1f ms" % (elapsed * 1000))
+    elapsed, _ = timed(build, None, parsetab)
+    print("parsetab %8.1f ms" % (elapsed * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Parse time of programs with a growing number of statements at the top
+level and inside a block, and of a function declaration and a call with a
+growing number of arguments. The time per item should stay flat as the
+count doubles.
+
+    python -m benchmarks.statements [max_count]
+"""
+import sys
+
+from benchmarks import build_parser, parse, timed
+from compiler.lexer import Lexer
+from rply.token import TokenBuffer
+
+
+def program(n):
+    return "print(1);\n" * n
+
+
+def block(n):
+    return "while (1) {\n%s}\n" % program(n)
+
+
+def args(n):
+    return "def int f(%s) { return(0); }\n" % ", ".join("int a%d" % i for i in range(n))
+
+
+def args_call(n):
+    return "f(%s);\n" % ", ".join("1" for i in range(n))
+
+
+def main(max_count=100000):
+    lexer = Lexer().build()
+    productions, parser = build_parser()
+    counts = [max_count >> i for i in range(3, -1, -1) if max_count >> i >= 1000]
+    for generate in [program, block, args, args_call]:
+        for n in counts:
+            tokens = TokenBuffer(lexer.lex(generate(n)))
+            elapsed, _ = timed(parse, productions, parser, tokens)
+            print("%-9s %7d %8.3fs %8.2f us/item" % (
+                generate.__name__, n, elapsed, elapsed / n * 1e6))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
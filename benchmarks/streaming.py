@@ -0,0 +1,52 @@
+"""
+Peak RSS while lexing a source file that was read into a string against one
+that is lexed from a memory map.
+
+    python -m benchmarks.streaming [megabytes ...]
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+from benchmarks import generate
+from compiler.lexer import Lexer, map_source
+
+
+def lex_file(mode, filename):
+    lexer = Lexer().build()
+    if mode == "mmap":
+        source = map_source(filename)
+    else:
+        source = open(filename).read()
+    n = 0
+    for _ in lexer.lex(source):
+        n += 1
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print("%d %d" % (n, rss))
+
+
+def main(*sizes):
+    chunk = generate(100)
+    with tempfile.TemporaryDirectory() as directory:
+        for megabytes in sizes or (8, 16, 32):
+            filename = os.path.join(directory, "%d.code" % megabytes)
+            with open(filename, "w") as f:
+                for _ in range(megabytes * 1024 * 1024 // len(chunk) + 1):
+                    f.write(chunk)
+            for mode in ("read", "mmap"):
+                out = subprocess.check_output([
+                    sys.executable, "-m", "benchmarks.streaming",
+                    "--child", mode, filename,
+                ])
+                n, rss = map(int, out.split())
+                print("%4d MB %-5s %9d tokens  peak RSS %7.1f MB" % (
+                    megabytes, mode, n, rss / 1024.0))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        lex_file(*sys.argv[2:])
+    else:
+        main(*map(int, sys.argv[1:]))
@@ -0,0 +1,56 @@
+"""
+Time to build LALR tables for the compiler grammar and for a synthetic
+expression grammar with one precedence level per operator.
+
+    python -m benchmarks.tables [levels]
+
+`levels` operators give 2 * levels + 5 productions (default: 250 levels,
+505 productions).
+"""
+import sys
+import warnings
+
+from benchmarks import timed
+from compiler.parser import Parser
+from rply import ParserGenerator
+from rply.parsergenerator import LRTable
+
+
+def noop(p):
+    return None
+
+
+def synthetic(levels):
+    # e_i : e_i OP_i e_(i+1) | e_(i+1), down to e_levels : ATOM | ( e_0 )
+    tokens = ["OP%d" % i for i in range(levels)] + ["ATOM", "(", ")", ";"]
+    pg = ParserGenerator(tokens)
+    pg.production("program : program statement")(noop)
+    pg.production("program : statement")(noop)
+    pg.production("statement : e0 ;")(noop)
+    for i in range(levels):
+        pg.production("e%d : e%d OP%d e%d" % (i, i, i, i + 1))(noop)
+        pg.production("e%d : e%d" % (i, i + 1))(noop)
+    pg.production("e%d : ATOM" % levels)(noop)
+    pg.production("e%d : ( e0 )" % levels)(noop)
+    return pg
+
+
+def build_table(pg):
+    g = pg._make_grammar()
+    g.build_lritems()
+    g.compute_first()
+    g.compute_follow()
+    return LRTable.from_grammar(g)
+
+
+def main(levels=250):
+    warnings.simplefilter("ignore")
+    for name, pg in [("compiler", Parser(None, None, None).pg),
+                     ("synthetic", synthetic(levels))]:
+        elapsed, table = timed(build_table, pg, repeat=1)
+        print("%-9s %4d productions %5d states %8.3fs" % (
+            name, len(pg.productions), len(table.lr_action), elapsed))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,35 @@
+"""
+Memory held by the tokens of a source: a list of Token objects against a
+TokenBuffer.
+
+    python -m benchmarks.tokens [copies]
+"""
+import sys
+import tracemalloc
+
+from benchmarks import generate, timed
+from compiler.lexer import Lexer
+from rply.token import TokenBuffer
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    result = func(*args)
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, peak, result
+
+
+def main(copies=2000):
+    source = generate(copies)
+    lexer = Lexer().build()
+    for name, store in [("list", list), ("buffer", TokenBuffer)]:
+        elapsed, _ = timed(store, lexer.lex(source), repeat=1)
+        size, peak, tokens = measure(store, lexer.lex(source))
+        print("%-7s %9d tokens %8.3fs %8.1f MB held %8.1f MB peak %6.1f bytes/token" % (
+            name, len(tokens), elapsed, size / 1024.0 / 1024, peak / 1024.0 / 1024,
+            size / float(len(tokens))))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
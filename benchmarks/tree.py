@@ -0,0 +1,64 @@
+"""
+Time and peak memory of writing the debug tree of a program with `count`
+statements using json.dumps and the streaming writer, plain and compact.
+
+    python -m benchmarks.tree [count]
+"""
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from benchmarks import timed
+from compiler import JSONparsedTree
+from compiler.JSONparsedTree import Node, ParsedTree, serialize
+
+
+def statement():
+    return Node("statement_full", [Node("statement", [Node("PRINT"), Node("("), Node("expression"), Node(")")]),
+                                   Node(";")])
+
+
+def program(count):
+    # Built bottom-up: the right-recursive chain is as deep as the program.
+    root = Node("program", [statement()])
+    for _ in range(count - 1):
+        root = Node("program", [statement(), root])
+    return Node("main", [root])
+
+
+def dumps(root):
+    data = json.dumps(ParsedTree(root), default=serialize)
+    with open('treant-js-master/dumps.json', 'w') as f:
+        f.write(data)
+
+
+def measure(func, *args):
+    try:
+        elapsed, _ = timed(func, *args, repeat=1)
+    except RecursionError:
+        return "RecursionError"
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return "%8.3fs %9.1f MB peak" % (elapsed, peak / 2 ** 20)
+
+
+def main(count=100000):
+    root = program(count)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        os.mkdir('treant-js-master')
+        try:
+            print("json.dumps   %s" % measure(dumps, root))
+            print("stream       %s" % measure(JSONparsedTree.write, root, "stream"))
+            print("compact      %s" % measure(JSONparsedTree.write, root, "compact", True))
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -1,11 +1,62 @@
+import math
+import struct
+from collections import deque
+
 from rply.token import BaseBox
 from compiler.JSONparsedTree import Node
 from compiler.errors import *
+from compiler.semantic import FunctionScope, TYPE_NAMES
 from llvmlite import ir
 
 
 global_fmt = 1
-fnctns = {}
+LLVM_TYPES = {'INT': ir.IntType(32), 'FLT': ir.FloatType()}
+
+
+def _allocate(scope, function):
+    """
+    Fills scope.ptrs with a stack slot for every variable of the scope, all
+    allocated at the start of the entry block of `function` so that mem2reg
+    can promote them, and with the argument itself for arguments kept in
+    registers.
+    """
+    builder = ir.IRBuilder()
+    builder.position_at_start(function.entry_basic_block)
+    scope.ptrs = []
+    for slot, symbol in enumerate(scope.symbols):
+        if symbol.in_register:
+            function.args[slot].name = symbol.name
+            scope.ptrs.append(function.args[slot])
+        else:
+            scope.ptrs.append(builder.alloca(LLVM_TYPES[symbol.type], size=None, name=symbol.name))
+
+
+def _loop_id(module):
+    """
+    A new llvm.loop metadata node, holding only a reference to itself, which
+    keeps every loop's node distinct. CodeGen appends the loop hints it is
+    configured with.
+    """
+    loop_id = ir.MDValue(module, [], name=str(len(module.metadata)))
+    loop_id.operands = (loop_id,)
+    return loop_id
+
+
+def _always_returns(statement):
+    """Whether every path through `statement` ends in a return"""
+    if isinstance(statement, Return):
+        return True
+    if isinstance(statement, StatementFull):
+        return _always_returns(statement.statement)
+    if isinstance(statement, Statement):
+        return _always_returns(statement.expression)
+    if isinstance(statement, (Program, Block)):
+        return any(_always_returns(s) for s in statement.statements)
+    if isinstance(statement, If):
+        return (statement.else_body is not None and _always_returns(statement.body)
+                and _always_returns(statement.else_body))
+    # A loop may run its body zero times
+    return False
 
 
 class Program(BaseBox):
@@ -13,31 +64,44 @@ class Program(BaseBox):
         self.state = state
         self.builder = builder
         self.module = module
+        # The grammar is right-recursive, so statements arrive last to first
+        # and are prepended to a deque shared with the inner Program.
         if type(program) is Program:
             self.statements = program.get_statements()
-            self.statements.insert(0, statement)
+            self.statements.appendleft(statement)
         else:
-            self.statements = [statement]
+            self.statements = deque([statement])
 
     def add_statement(self, statement):
-        self.statements.insert(0, statement)
+        self.statements.appendleft(statement)
 
     def get_statements(self):
         return self.statements
 
+    def analyze(self, scope):
+        for statement in self.statements:
+            statement.analyze(scope)
+
+    def fold(self):
+        for statement in self.statements:
+            statement.fold()
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
         result = None
         for i, statement in enumerate(self.statements):
-            left = Node('statement_full')
-            right = Node('program')
-            if i == len(self.statements) - 1:
-                node.children.extend([left])
-            else:
-                node.children.extend([left, right])
-            node = right
+            left = None
+            if node is not None:
+                left = Node('statement_full')
+                right = Node('program')
+                if i == len(self.statements) - 1:
+                    node.children.extend([left])
+                else:
+                    node.children.extend([left, right])
+                node = right
             result = statement.eval(left, builder=builder)
         return result
 
@@ -49,29 +113,40 @@ class Block(BaseBox):
         self.module = module
         if type(block) is Block:
             self.statements = block.get_statements()
-            self.statements.insert(0, statement)
+            self.statements.appendleft(statement)
         else:
-            self.statements = [statement]
+            self.statements = deque([statement])
 
     def add_statement(self, statement):
-        self.statements.insert(0, statement)
+        self.statements.appendleft(statement)
 
     def get_statements(self):
         return self.statements
 
+    def analyze(self, scope):
+        for statement in self.statements:
+            statement.analyze(scope)
+
+    def fold(self):
+        for statement in self.statements:
+            statement.fold()
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
         result = None
         for i, statement in enumerate(self.statements):
-            left = Node('statement_full')
-            right = Node('block')
-            if i == len(self.statements) - 1:
-                node.children.extend([left])
-            else:
-                node.children.extend([left, right])
-            node = right
+            left = None
+            if node is not None:
+                left = Node('statement_full')
+                right = Node('block')
+                if i == len(self.statements) - 1:
+                    node.children.extend([left])
+                else:
+                    node.children.extend([left, right])
+                node = right
 
             result = statement.eval(left, builder=builder)
         return result
@@ -86,7 +161,8 @@ class Arg(BaseBox):
         self.name = name
 
     def eval(self, node):
-        node.children.extend([Node('type', self.typ), Node('IDENTIFIER', self.name)])
+        if node is not None:
+            node.children.extend([Node('type', self.typ), Node('IDENTIFIER', self.name)])
         return self
 
 
@@ -99,25 +175,26 @@ class Args(BaseBox):
 
         if type(args) is Args:
             self.args = args.get_args()
-            self.args.insert(0, arg)
+            self.args.appendleft(arg)
         else:
-            self.args = [self.arg]
+            self.args = deque([self.arg])
 
     def add_arg(self, arg):
-        self.args.insert(0, arg)
+        self.args.appendleft(arg)
 
     def get_args(self):
         return self.args
 
     def eval(self, node):
-        for i, statement in enumerate(self.args):
-            left = Node('arg')
-            right = Node('args')
-            if i == len(self.args) - 1:
-                node.children.extend([left])
-            else:
-                node.children.extend([left, right])
-            node = right
+        if node is not None:
+            for i, statement in enumerate(self.args):
+                left = Node('arg')
+                right = Node('args')
+                if i == len(self.args) - 1:
+                    node.children.extend([left])
+                else:
+                    node.children.extend([left, right])
+                node = right
 
         return self.args
 
@@ -131,29 +208,38 @@ class ArgsCall(BaseBox):
 
         if type(args) is ArgsCall:
             self.args = args.get_args()
-            self.args.insert(0, arg)
+            self.args.appendleft(arg)
         else:
-            self.args = [self.arg]
+            self.args = deque([self.arg])
 
     def add_arg(self, arg):
-        self.args.insert(0, arg)
+        self.args.appendleft(arg)
 
     def get_args(self):
         return self.args
 
+    def analyze(self, scope):
+        return [statement.analyze(scope) for statement in self.args]
+
+    def fold(self):
+        self.args = deque([statement.fold() for statement in self.args])
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
         # print(self.args)
         args = []
         for i, statement in enumerate(self.args):
-            left = Node('expression')
-            right = Node('args_call')
-            if i == len(self.args) - 1:
-                node.children.extend([left])
-            else:
-                node.children.extend([left, right])
-            node = right
+            left = None
+            if node is not None:
+                left = Node('expression')
+                right = Node('args_call')
+                if i == len(self.args) - 1:
+                    node.children.extend([left])
+                else:
+                    node.children.extend([left, right])
+                node = right
             args.append(statement.eval(left, builder=builder))
 
         return args
@@ -168,16 +254,30 @@ class If(BaseBox):
         self.builder = builder
         self.module = module
 
+    def analyze(self, scope):
+        self.condition.analyze(scope)
+        self.body.analyze(scope)
+        if self.else_body is not None:
+            self.else_body.analyze(scope)
+
+    def fold(self):
+        self.condition = self.condition.fold()
+        self.body.fold()
+        if self.else_body is not None:
+            self.else_body.fold()
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        expression = Node("expression")
-        node.children.extend([Node("IF"), Node("("), expression, Node(")")])
+        expression = block = else_block = None
+        if node is not None:
+            expression = Node("expression")
+            block = Node("block")
+            else_block = Node("block")
+            node.children.extend([Node("IF"), Node("("), expression, Node(")"), Node("{"), block, Node("}")])
         condition = self.condition.eval(expression, builder=builder)
-        block = Node("block")
-        node.children.extend([Node("{"), block, Node("}")])
-        else_block = Node("block")
 
         if self.else_body is not None:
             with builder.if_else(condition) as (then, otherwise):
@@ -191,7 +291,7 @@ class If(BaseBox):
                     self.body.eval(block, builder=builder)
                 with otherwise:
                     pass
-        if self.else_body is not None:
+        if self.else_body is not None and node is not None:
             node.children.extend([Node("else"), Node("{"), else_block, Node("}")])
         # if bool(condition) is True:
         #     return self.body.eval(block)
@@ -209,37 +309,49 @@ class While(BaseBox):
         self.builder = builder
         self.module = module
 
+    def analyze(self, scope):
+        self.condition.analyze(scope)
+        scope.loops += 1
+        self.body.analyze(scope)
+        scope.loops -= 1
+
+    def fold(self):
+        self.condition = self.condition.fold()
+        self.body.fold()
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        expression = Node("expression")
-        node.children.extend([Node("WHILE"), Node("("), expression, Node(")")])
-        condition = self.condition.eval(expression, builder=builder)
-        block = Node("block")
-        node.children.extend([Node("{"), block, Node("}")])
-        tmp = None
+        expression = block = None
+        if node is not None:
+            expression = Node("expression")
+            block = Node("block")
+            node.children.extend([Node("WHILE"), Node("("), expression, Node(")"), Node("{"), block, Node("}")])
 
+        # while_cond tests the condition and is the target of the back edge
+        # and of continue; while_end is the target of break.
+        while_cond = builder.append_basic_block('while_cond')
         while_block = builder.append_basic_block('while')
-        self.state.while_body.append(while_block)
         while_block_end = builder.append_basic_block('while_end')
-        self.state.while_end.append(while_block_end)
+        builder.branch(while_cond)
 
+        builder.position_at_end(while_cond)
+        condition = self.condition.eval(expression, builder=builder)
         builder.cbranch(condition, while_block, while_block_end)
 
         builder.position_at_end(while_block)
+        self.state.while_cond.append(while_cond)
+        self.state.while_end.append(while_block_end)
         self.body.eval(block, builder=builder)
-        condition = self.condition.eval(expression, builder=builder)
-        builder.cbranch(condition, while_block, while_block_end)
-
-        builder.position_at_end(while_block_end)
-        self.state.while_body.pop()
+        self.state.while_cond.pop()
         self.state.while_end.pop()
+        if not builder.block.is_terminated:
+            back_edge = builder.branch(while_cond)
+            back_edge.set_metadata('llvm.loop', _loop_id(self.module))
 
-        if bool(condition) is True:
-            return tmp
-        else:
-            pass
+        builder.position_at_end(while_block_end)
         return None
 
 
@@ -249,12 +361,22 @@ class Break(BaseBox):
         self.builder = builder
         self.module = module
 
+    def analyze(self, scope):
+        if not scope.loops:
+            raise LogicError("<break> outside of a loop")
+
+    def fold(self):
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        node.children.extend([Node("BREAK")])
+        if node is not None:
+            node.children.extend([Node("BREAK")])
         builder.branch(self.state.while_end[-1])
+        # Code after the branch is unreachable, but still needs a block
+        builder.position_at_end(builder.append_basic_block('after_break'))
 
 
 class Continue(BaseBox):
@@ -263,12 +385,22 @@ class Continue(BaseBox):
         self.builder = builder
         self.module = module
 
+    def analyze(self, scope):
+        if not scope.loops:
+            raise LogicError("<continue> outside of a loop")
+
+    def fold(self):
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        node.children.extend([Node("BREAK")])
-        builder.branch(self.state.while_body[-1])
+        if node is not None:
+            node.children.extend([Node("CONTINUE")])
+        builder.branch(self.state.while_cond[-1])
+        # Code after the branch is unreachable, but still needs a block
+        builder.position_at_end(builder.append_basic_block('after_continue'))
 
 
 class Variable(BaseBox):
@@ -282,24 +414,24 @@ class Variable(BaseBox):
     def get_name(self):
         return str(self.name)
 
+    def analyze(self, scope):
+        symbol = scope.resolve(self.name)
+        self.scope = scope
+        self.slot = symbol.slot
+        self.type = symbol.type
+        return self.type
+
+    def fold(self):
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        identifier = Node("IDENTIFIER")
-        # node.children.extend([identifier])
-        v_name = self.name
-
-        if v_name not in self.state.variables[builder.function].keys():
-            raise LogicError("Unknown name: <%s> is not defined in function <%s>" % (str(self.name), builder.function._name))
-
-        if self.state.variables[builder.function][v_name] is not None:
-            self.value = self.state.variables[builder.function][v_name]['value']
-            identifier.children.extend([Node(self.name, [Node(self.value)])])
-            i = builder.load(self.state.variables[builder.function][v_name]['ptr'], v_name)
-            return i
-        identifier.children.extend([Node("Unknown name: <%s> is not defined" % str(self.name))])
-        raise LogicError("Unknown name: <%s> is not defined in function <%s>" % (str(self.name), builder.function._name))
+        ptr = self.scope.ptrs[self.slot]
+        if self.scope.symbols[self.slot].in_register:
+            return ptr
+        return builder.load(ptr, self.name)
 
     def to_string(self):
         return str(self.name)
@@ -314,41 +446,49 @@ class FunctionDeclaration(BaseBox):
         self.builder = builder
         self.module = module
         self.state = state
-        state.functions[self.name] = self
+        self.func = None
+
+    def analyze(self, scope):
+        if self.name in self.state.functions:
+            raise LogicError("Function <%s> is already defined" % self.name)
+        self.scope = FunctionScope(self.name, TYPE_NAMES[self.typ])
+        self.arg_types = []
+        for arg in self.args.get_args():
+            self.scope.declare(arg.name.getstr(), TYPE_NAMES[arg.typ], argument=True)
+            self.arg_types.append(TYPE_NAMES[arg.typ])
+        self.state.functions[self.name] = self
+        self.state.scopes.append(self.scope)
+        self.block.analyze(self.scope)
+        if not _always_returns(self.block):
+            raise LogicError("<%s>-type function <%s> does not return a value on every path" % (self.scope.type, self.name))
+
+    def fold(self):
+        self.block.fold()
+        return self
 
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        identifier = Node(self.name)
-        node.children.extend([Node("FUNCTION"), Node('type', self.typ), identifier, Node("{"), Node("block"), Node("}")])
-
-        int_ = ir.IntType(32)
-        flt_ = ir.FloatType()
-        f_typ = {'int': int_, 'float': flt_}
+        if node is not None:
+            node.children.extend([Node("FUNCTION"), Node('type', self.typ), Node(self.name), Node("{"), Node("block"), Node("}")])
 
-        f_args = [f_typ[i.typ] for i in self.args.get_args()]
-
-        fnty = ir.FunctionType(f_typ[self.typ], f_args)
+        fnty = ir.FunctionType(LLVM_TYPES[self.scope.type], [LLVM_TYPES[typ] for typ in self.arg_types])
         func = ir.Function(self.module, fnty, name=self.name)
-        fnctns[self.name] = func
+        self.func = func
         block = func.append_basic_block(name="entry")
+        _allocate(self.scope, func)
         f_builder = ir.IRBuilder(block)
-        self.state.variables[f_builder.function] = {}
-        self.state.variables[f_builder.function]['args'] = {}
-        types_dict = {ir.IntType(32): 'INT', ir.FloatType(): 'FLT', str: 'STR'}
-        for arg_ in range(len(func.args)):
-            var_name = self.args.get_args()[arg_].name.getstr()
-            var_type = func.args[arg_].type
-            alloc = f_builder.alloca(var_type, size=None, name=var_name)
-            if f_builder.function not in self.state.variables.keys():
-                self.state.variables[f_builder.function] = {}
-            self.state.variables[f_builder.function][var_name] = {'value': func.args[arg_], 'type': types_dict[var_type], 'ptr': alloc}
-            f_builder.store(func.args[arg_], alloc)
-
-        # print(self.state.variables)
-
-        self.block.eval(Node('block'), builder=f_builder)
+        # Arguments take the first slots of the function's scope
+        for slot, arg in enumerate(func.args):
+            if not self.scope.symbols[slot].in_register:
+                f_builder.store(arg, self.scope.ptrs[slot])
+
+        self.block.eval(None, builder=f_builder)
+        # Every path has returned, so the block the builder ends in (after
+        # a return, or after an if whose branches both return) is unreachable
+        if not f_builder.block.is_terminated:
+            f_builder.unreachable()
         # a, b = func.args
         # result = f_builder.sub(a, b, name="res")
         # f_builder.ret(ir.Constant(ir.IntType(8), 1))
@@ -366,15 +506,31 @@ class CallFunction(BaseBox):
         self.builder = builder
         self.module = module
 
+    def analyze(self, scope):
+        self.function = self.state.functions.get(self.name)
+        if self.function is None:
+            raise LogicError("Unknown function: <%s>" % self.name)
+        arg_types = self.args.analyze(scope) if self.args is not None else []
+        if arg_types != self.function.arg_types:
+            raise LogicError("Function <%s> takes (%s), got (%s)" % (
+                self.name, ", ".join(self.function.arg_types), ", ".join(arg_types)))
+        self.type = self.function.scope.type
+        return self.type
+
+    def fold(self):
+        if self.args is not None:
+            self.args.fold()
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        identifier = Node(self.name + " ( )")
-        node.children.extend([identifier])
+        if node is not None:
+            node.children.extend([Node(self.name + " ( )")])
 
-        args_eval = self.args.eval(Node('args_call'), builder=builder)
-        res = builder.call(fnctns[self.name], args_eval)
+        args_eval = self.args.eval(None, builder=builder) if self.args is not None else []
+        res = builder.call(self.function.func, args_eval)
         return res
 
         # return self.state.functions[self.name].block.eval(identifier, builder=builder)
@@ -390,25 +546,62 @@ class Return(BaseBox):
         self.module = module
         self.statement = statement
 
+    def analyze(self, scope):
+        if self.statement is None:
+            if scope.type is not None:
+                raise LogicError("<return> without a value in <%s>-type function <%s>" % (scope.type, scope.name))
+            return
+        typ = self.statement.analyze(scope)
+        if scope.type is None:
+            raise LogicError("Cannot return a value from <%s>" % scope.name)
+        if typ != scope.type:
+            raise LogicError("Cannot return <%s> from <%s>-type function <%s>" % (typ, scope.type, scope.name))
+
+    def fold(self):
+        if self.statement is not None:
+            self.statement = self.statement.fold()
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        statement = Node('expression', self.statement)
-        node.children.extend([Node("RETURN"), Node('('), statement, Node(')')])
+        statement = None
+        if node is not None:
+            statement = Node('expression', self.statement)
+            node.children.extend([Node("RETURN"), Node('('), statement, Node(')')])
         if self.statement is None:
             builder.ret_void()
         else:
             builder.ret(self.statement.eval(statement, builder=builder))
+        # Statements after the return go to a block of their own
+        builder.position_at_end(builder.append_basic_block('after_return'))
 
 
 class BaseFunction(BaseBox):
+    # Name of the builtin and the type of its arguments and result
+    name = None
+    type = None
+    operand_type = None
+
     def __init__(self, expression, state):
         self.expression = expression
         self.value = None
         self.state = state
         self.roundOffDigits = 10
 
+    def analyze(self, scope):
+        for expression in (self.expression, self.expression2):
+            typ = expression.analyze(scope)
+            if typ != self.type:
+                raise LogicError("<%s> takes <%s> arguments, got <%s>" % (self.name, self.type, typ))
+        return self.type
+
+    def fold(self):
+        self.expression = self.expression.fold()
+        self.expression2 = self.expression2.fold()
+        return _fold_constants(self, self.expression, self.expression2) or self
+
     def eval(self, node):
         raise NotImplementedError("This is abstract method from abstract class BaseFunction(BaseBox){...} !")
 
@@ -417,6 +610,9 @@ class BaseFunction(BaseBox):
 
 
 class Sumi(BaseFunction):
+    name = 'sum'
+    type = operand_type = 'INT'
+
     def __init__(self, args, builder, module, state):
         super().__init__(args[0], state)
         self.expression2 = args[1]
@@ -424,21 +620,24 @@ class Sumi(BaseFunction):
         self.builder = builder
         self.module = module
 
+    def compute(self, a, b):
+        return a + b
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        expression = Node("expression")
-        expression2 = Node("expression")
-        # node.children.extend([Node("CALLSUMI"), Node("("), expression, Node(","), expression2, Node(")")])
-        self.value = self.expression.eval(expression, builder=builder)
-        self.value2 = self.expression2.eval(expression2, builder=builder)
+        self.value = self.expression.eval(None, builder=builder)
+        self.value2 = self.expression2.eval(None, builder=builder)
 
-        res = builder.call(fnctns['sum'], (self.value, self.value2))
+        res = builder.add(self.value, self.value2)
         return res
 
 
 class Sumf(BaseFunction):
+    name = 'sumf'
+    type = operand_type = 'FLT'
+
     def __init__(self, args, builder, module, state):
         super().__init__(args[0], state)
         self.expression2 = args[1]
@@ -446,21 +645,24 @@ class Sumf(BaseFunction):
         self.builder = builder
         self.module = module
 
+    def compute(self, a, b):
+        return a + b
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        expression = Node("expression")
-        expression2 = Node("expression")
-        # node.children.extend([Node("CALLSUMF"), Node("("), expression, Node(","), expression2, Node(")")])
-        self.value = self.expression.eval(expression, builder=builder)
-        self.value2 = self.expression2.eval(expression2, builder=builder)
+        self.value = self.expression.eval(None, builder=builder)
+        self.value2 = self.expression2.eval(None, builder=builder)
 
-        res = builder.call(fnctns['sumf'], (self.value, self.value2))
+        res = builder.fadd(self.value, self.value2)
         return res
 
 
 class Subi(BaseFunction):
+    name = 'sub'
+    type = operand_type = 'INT'
+
     def __init__(self, args, builder, module, state):
         super().__init__(args[0], state)
         self.expression2 = args[1]
@@ -468,21 +670,24 @@ class Subi(BaseFunction):
         self.builder = builder
         self.module = module
 
+    def compute(self, a, b):
+        return a - b
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        expression = Node("expression")
-        expression2 = Node("expression")
-        # node.children.extend([Node("CALLSUBI"), Node("("), expression, Node(","), expression2, Node(")")])
-        self.value = self.expression.eval(expression, builder=builder)
-        self.value2 = self.expression2.eval(expression2, builder=builder)
+        self.value = self.expression.eval(None, builder=builder)
+        self.value2 = self.expression2.eval(None, builder=builder)
 
-        res = builder.call(fnctns['sub'], (self.value, self.value2))
+        res = builder.sub(self.value, self.value2)
         return res
 
 
 class Subf(BaseFunction):
+    name = 'subf'
+    type = operand_type = 'FLT'
+
     def __init__(self, args, builder, module, state):
         super().__init__(args[0], state)
         self.expression2 = args[1]
@@ -490,41 +695,48 @@ class Subf(BaseFunction):
         self.builder = builder
         self.module = module
 
+    def compute(self, a, b):
+        return a - b
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        expression = Node("expression")
-        expression2 = Node("expression")
-        # node.children.extend([Node("CALLSUBF"), Node("("), expression, Node(","), expression2, Node(")")])
-        self.value = self.expression.eval(expression, builder=builder)
-        self.value2 = self.expression2.eval(expression2, builder=builder)
+        self.value = self.expression.eval(None, builder=builder)
+        self.value2 = self.expression2.eval(None, builder=builder)
 
-        res = builder.call(fnctns['subf'], (self.value, self.value2))
+        res = builder.fsub(self.value, self.value2)
         return res
 
 
 class Constant(BaseBox):
+    type = None
+
     def __init__(self, state, builder, module):
         self.value = None
         self.state = state
         self.builder = builder
         self.module = module
 
+    def analyze(self, scope):
+        return self.type
+
+    def fold(self):
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        value = Node(self.value)
-        typed = Node(self.__class__.__name__.upper(), [value])
-        constant = Node("const", [typed])
-        # node.children.extend([constant])
-        if self.__class__.__name__.upper() == 'INTEGER':
+        if self.type == 'INT':
             i = ir.Constant(ir.IntType(32), int(self.value))
             return i
-        elif self.__class__.__name__.upper() == 'FLOAT':
+        elif self.type == 'FLT':
             i = ir.Constant(ir.FloatType(), float(self.value))
             return i
+        elif self.type == 'BOOL':
+            i = ir.Constant(ir.IntType(1), int(self.value))
+            return i
         return self.value
 
     def to_string(self):
@@ -532,6 +744,8 @@ class Constant(BaseBox):
 
 
 class Integer(Constant):
+    type = 'INT'
+
     def __init__(self, value, state, builder, module):
         super().__init__(state, builder, module)
         self.value = int(value)
@@ -541,6 +755,8 @@ class Integer(Constant):
 
 
 class Float(Constant):
+    type = 'FLT'
+
     def __init__(self, value, state, builder, module):
         super().__init__(state, builder, module)
         self.value = float(value)
@@ -549,7 +765,20 @@ class Float(Constant):
         return str(self.value)
 
 
+class Boolean(Constant):
+    type = 'BOOL'
+
+    def __init__(self, value, state, builder, module):
+        super().__init__(state, builder, module)
+        self.value = int(bool(value))
+
+    def to_string(self):
+        return str(bool(self.value)).lower()
+
+
 class String(Constant):
+    type = 'STR'
+
     def __init__(self, value, state, builder, module):
         super().__init__(state, builder, module)
         self.value = str(value)
@@ -558,7 +787,78 @@ class String(Constant):
         return '"%s"' % str(self.value)
 
 
+def _wrap(value):
+    """`value` as a 32-bit two's complement integer, as i32 arithmetic wraps"""
+    return (int(value) + 0x80000000) % 0x100000000 - 0x80000000
+
+
+def _f32(value):
+    """`value` rounded to single precision, or None if that is not finite"""
+    try:
+        value = struct.unpack('f', struct.pack('f', value))[0]
+    except OverflowError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _constant(typ, value, state, builder, module):
+    if value is None:
+        return None
+    if typ == 'INT':
+        return Integer(_wrap(value), state, builder, module)
+    if typ == 'FLT':
+        value = _f32(value)
+        return None if value is None else Float(value, state, builder, module)
+    if typ == 'BOOL':
+        return Boolean(value, state, builder, module)
+    return None
+
+
+def _fold_constants(node, left, right):
+    """
+    Constant holding the result of `node` if both operands are constants and
+    node.compute() folds them at compile time, otherwise None. Operands and
+    results are rounded the way i32 and float arithmetic would round them.
+    """
+    if not (isinstance(left, Constant) and isinstance(right, Constant)):
+        return None
+    a, b = left.value, right.value
+    if node.operand_type == 'INT':
+        a, b = _wrap(a), _wrap(b)
+    elif node.operand_type == 'FLT':
+        a, b = _f32(a), _f32(b)
+        if a is None or b is None:
+            return None
+    elif node.operand_type != 'BOOL':
+        return None
+    return _constant(node.type, node.compute(a, b), node.state, node.builder, node.module)
+
+
+def _is_constant(node, value):
+    # Compares signs as well, so that 0.0 and -0.0 are told apart
+    return (isinstance(node, Constant) and node.value == value
+            and math.copysign(1, node.value) == math.copysign(1, value))
+
+
+def _is_pure(node):
+    """Whether evaluating `node` has no effect other than producing its value"""
+    if isinstance(node, (Constant, Variable)):
+        return True
+    if isinstance(node, ExpressParenthesis):
+        return _is_pure(node.expression)
+    if isinstance(node, (Additive, Not)):
+        return _is_pure(node.value)
+    if isinstance(node, BinaryOp):
+        return _is_pure(node.left) and _is_pure(node.right)
+    if isinstance(node, BaseFunction):
+        return _is_pure(node.expression) and _is_pure(node.expression2)
+    return False
+
+
 class BinaryOp(BaseBox):
+    # Type of the result when it is not the type of the operands
+    result_type = None
+
     def __init__(self, left, right, state, builder, module):
         self.left = left
         self.right = right
@@ -566,6 +866,31 @@ class BinaryOp(BaseBox):
         self.module = module
         self.builder = builder
 
+    def analyze(self, scope):
+        left = self.left.analyze(scope)
+        right = self.right.analyze(scope)
+        if left != right:
+            raise LogicError("Operands must be the same type, got <%s> and <%s>" % (left, right))
+        self.operand_type = left
+        self.type = self.result_type or left
+        return self.type
+
+    def fold(self):
+        self.left = self.left.fold()
+        self.right = self.right.fold()
+        return _fold_constants(self, self.left, self.right) or self.simplify()
+
+    def compute(self, a, b):
+        """
+        Result of the operation on the constant operands `a` and `b`, or None
+        if it has to be left to run time.
+        """
+        return None
+
+    def simplify(self):
+        """Replacement for the operation with an identity applied, or self"""
+        return self
+
 
 class Assignment(BinaryOp):
     def __init__(self, left, right, state, builder, module, new=True, type_='INT'):
@@ -573,64 +898,65 @@ class Assignment(BinaryOp):
         self.new = new
         self.type_ = type_
 
+    def analyze(self, scope):
+        if not isinstance(self.left, Variable):
+            raise LogicError("Cannot assign to <%s>" % self)
+        var_name = self.left.get_name()
+        if self.new:
+            if var_name in scope:
+                raise ImmutableError(var_name)
+            typ = self.right.analyze(scope)
+            symbol = scope.declare(var_name, self.type_)
+        else:
+            if var_name not in scope:
+                raise LogicError("Variable <%s> is not defined" % var_name)
+            typ = self.right.analyze(scope)
+            symbol = scope.resolve(var_name)
+            symbol.assigned = True
+        if typ != symbol.type:
+            raise LogicError('Cannot assign <%s> to <%s>-type variable' % (typ, symbol.type))
+        self.scope = scope
+        self.slot = symbol.slot
+
+    def fold(self):
+        self.right = self.right.fold()
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        if isinstance(self.left, Variable):
-            var_name = self.left.get_name()
-            types_dict = {ir.IntType(32): 'INT', ir.FloatType(): 'FLT', str: 'STR'}
+        var_name = self.left.get_name()
+        expression = None
+        if node is not None:
+            expression = Node("expression")
             if self.new:
-                if builder.function not in self.state.variables.keys():
-                    self.state.variables[builder.function] = {}
-                if var_name not in self.state.variables[builder.function].keys():
-                    identifier = Node("IDENTIFIER", [Node(var_name)])
-                    expression = Node("expression")
-                    node.children.extend([Node("LET"), identifier, Node("="), expression])
-                    tmp_eval = self.right.eval(expression, builder=builder)
-                    if types_dict[tmp_eval.type] != self.type_:
-                        raise LogicError('Cannot assign <%s> to <%s>-type variable' %
-                                         (types_dict[type(tmp_eval)], self.type_))
-                    alloc = builder.alloca(tmp_eval.type, size=None, name=var_name)
-                    if builder.function not in self.state.variables.keys():
-                        self.state.variables[builder.function] = {}
-                    self.state.variables[builder.function][var_name] = {'value': tmp_eval, 'type': self.type_, 'ptr': alloc}
-                    builder.store(tmp_eval, alloc)
-                    return self.state.variables
-                else:
-                    raise ImmutableError(var_name)
+                node.children.extend([Node("LET"), Node("IDENTIFIER", [Node(var_name)]), Node("="), expression])
             else:
-                if var_name in self.state.variables[builder.function].keys():
-                    identifier = Node("IDENTIFIER", [Node(var_name)])
-                    expression = Node("expression")
-                    node.children.extend([identifier, Node("="), expression])
-                    tmp_eval = self.right.eval(expression, builder=builder)
-                    # print(type(tmp_eval))
-                    # if types_dict[type(tmp_eval)] != self.state.variables[var_name]['type']:
-                    #     raise LogicError('Cannot assign <%s> to <%s>-type variable' %
-                    #                      (types_dict[type(tmp_eval)], self.type_))
-                    self.state.variables[builder.function][var_name]['value'] = tmp_eval
-                    alloc = self.state.variables[builder.function][var_name]['ptr']
-                    builder.store(tmp_eval, alloc)
-                    return self.state.variables
-                else:
-                    raise LogicError("Variable <%s> is not defined" % var_name)
-
-        else:
-            raise LogicError("Cannot assign to <%s>" % self)
+                node.children.extend([Node("IDENTIFIER", [Node(var_name)]), Node("="), expression])
+        tmp_eval = self.right.eval(expression, builder=builder)
+        builder.store(tmp_eval, self.scope.ptrs[self.slot])
 
 
 class Sum(BinaryOp):
+    def compute(self, a, b):
+        return a + b
+
+    def simplify(self):
+        if self.operand_type == 'INT':
+            if _is_constant(self.right, 0):
+                return self.left
+            if _is_constant(self.left, 0):
+                return self.right
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        left = Node("expression")
-        right = Node("expression")
-        # node.children.extend([left, Node("+"), right])
-        eval_left = self.left.eval(left, builder=builder)
-        eval_right = self.right.eval(right, builder=builder)
-        if eval_left.type == ir.FloatType():
+        eval_left = self.left.eval(None, builder=builder)
+        eval_right = self.right.eval(None, builder=builder)
+        if self.operand_type == 'FLT':
             i = builder.fadd(eval_left, eval_right)
         else:
             i = builder.add(eval_left, eval_right)
@@ -638,16 +964,30 @@ class Sum(BinaryOp):
 
 
 class Sub(BinaryOp):
+    def compute(self, a, b):
+        return a - b
+
+    def simplify(self):
+        if _is_constant(self.right, 0):
+            return self.left
+        if self.operand_type == 'INT' and _is_constant(self.left, 0):
+            negation = Additive(self.right, self.state, self.builder, self.module)
+            negation.type = self.type
+            return negation
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        left = Node("expression")
-        right = Node("expression")
-        node.children.extend([left, Node("-"), right])
+        left = right = None
+        if node is not None:
+            left = Node("expression")
+            right = Node("expression")
+            node.children.extend([left, Node("-"), right])
         eval_left = self.left.eval(left, builder=builder)
         eval_right = self.right.eval(right, builder=builder)
-        if eval_left.type == ir.FloatType():
+        if self.operand_type == 'FLT':
             i = builder.fsub(eval_left, eval_right)
         else:
             i = builder.sub(eval_left, eval_right)
@@ -655,16 +995,33 @@ class Sub(BinaryOp):
 
 
 class Mul(BinaryOp):
+    def compute(self, a, b):
+        return a * b
+
+    def simplify(self):
+        if _is_constant(self.right, 1):
+            return self.left
+        if _is_constant(self.left, 1):
+            return self.right
+        if self.operand_type == 'INT':
+            if _is_constant(self.right, 0) and _is_pure(self.left):
+                return self.right
+            if _is_constant(self.left, 0) and _is_pure(self.right):
+                return self.left
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        left = Node("expression")
-        right = Node("expression")
-        node.children.extend([left, Node("*"), right])
+        left = right = None
+        if node is not None:
+            left = Node("expression")
+            right = Node("expression")
+            node.children.extend([left, Node("*"), right])
         eval_left = self.left.eval(left, builder=builder)
         eval_right = self.right.eval(right, builder=builder)
-        if eval_left.type == ir.FloatType():
+        if self.operand_type == 'FLT':
             i = builder.fmul(eval_left, eval_right)
         else:
             i = builder.mul(eval_left, eval_right)
@@ -672,16 +1029,34 @@ class Mul(BinaryOp):
 
 
 class Div(BinaryOp):
+    def compute(self, a, b):
+        if b == 0:
+            return None
+        if self.operand_type == 'FLT':
+            return a / b
+        if a == -0x80000000 and b == -1:
+            return None
+        # sdiv rounds towards zero
+        quotient = abs(a) // abs(b)
+        return quotient if (a < 0) == (b < 0) else -quotient
+
+    def simplify(self):
+        if _is_constant(self.right, 1):
+            return self.left
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        left = Node("expression")
-        right = Node("expression")
-        node.children.extend([left, Node("/"), right])
+        left = right = None
+        if node is not None:
+            left = Node("expression")
+            right = Node("expression")
+            node.children.extend([left, Node("/"), right])
         eval_left = self.left.eval(left, builder=builder)
         eval_right = self.right.eval(right, builder=builder)
-        if eval_left.type == ir.FloatType():
+        if self.operand_type == 'FLT':
             i = builder.fdiv(eval_left, eval_right)
         else:
             i = builder.sdiv(eval_left, eval_right)
@@ -695,31 +1070,52 @@ class Additive(BaseBox):
         self.builder = builder
         self.module = module
 
+    def analyze(self, scope):
+        self.type = self.value.analyze(scope)
+        return self.type
+
+    def fold(self):
+        self.value = self.value.fold()
+        if isinstance(self.value, Constant):
+            return _constant(self.type, -self.value.value, self.state, self.builder, self.module) or self
+        if isinstance(self.value, Additive):
+            return self.value.value
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        right = Node("expression")
-        node.children.extend([Node("-"), right])
+        right = None
+        if node is not None:
+            right = Node("expression")
+            node.children.extend([Node("-"), right])
         eval_right = self.value.eval(right, builder=builder)
-        if eval_right.type == ir.FloatType():
-            i = builder.fsub(ir.Constant(ir.FloatType(), 0.0), eval_right)
+        if self.type == 'FLT':
+            i = builder.fneg(eval_right)
         else:
-            i = builder.mul(ir.Constant(ir.IntType(32), -1), eval_right)
+            i = builder.neg(eval_right)
         return i
 
 
 class Equal(BinaryOp):
+    result_type = 'BOOL'
+
+    def compute(self, a, b):
+        return a == b
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        left = Node("expression")
-        right = Node("expression")
-        node.children.extend([left, Node("=="), right])
+        left = right = None
+        if node is not None:
+            left = Node("expression")
+            right = Node("expression")
+            node.children.extend([left, Node("=="), right])
         eval_left = self.left.eval(left, builder=builder)
         eval_right = self.right.eval(right, builder=builder)
-        if eval_left.type == ir.FloatType():
+        if self.operand_type == 'FLT':
             i = builder.fcmp_ordered('==', eval_left, eval_right)
         else:
             i = builder.icmp_signed('==', eval_left, eval_right)
@@ -727,16 +1123,23 @@ class Equal(BinaryOp):
 
 
 class NotEqual(BinaryOp):
+    result_type = 'BOOL'
+
+    def compute(self, a, b):
+        return a != b
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        left = Node("expression")
-        right = Node("expression")
-        node.children.extend([left, Node("!="), right])
+        left = right = None
+        if node is not None:
+            left = Node("expression")
+            right = Node("expression")
+            node.children.extend([left, Node("!="), right])
         eval_left = self.left.eval(left, builder=builder)
         eval_right = self.right.eval(right, builder=builder)
-        if eval_left.type == ir.FloatType():
+        if self.operand_type == 'FLT':
             i = builder.fcmp_ordered('!=', eval_left, eval_right)
         else:
             i = builder.icmp_signed('!=', eval_left, eval_right)
@@ -744,16 +1147,23 @@ class NotEqual(BinaryOp):
 
 
 class GreaterThan(BinaryOp):
+    result_type = 'BOOL'
+
+    def compute(self, a, b):
+        return a > b
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        left = Node("expression")
-        right = Node("expression")
-        node.children.extend([left, Node(">"), right])
+        left = right = None
+        if node is not None:
+            left = Node("expression")
+            right = Node("expression")
+            node.children.extend([left, Node(">"), right])
         eval_left = self.left.eval(left, builder=builder)
         eval_right = self.right.eval(right, builder=builder)
-        if eval_left.type == ir.FloatType():
+        if self.operand_type == 'FLT':
             i = builder.fcmp_ordered('>', eval_left, eval_right)
         else:
             i = builder.icmp_signed('>', eval_left, eval_right)
@@ -761,16 +1171,23 @@ class GreaterThan(BinaryOp):
 
 
 class LessThan(BinaryOp):
+    result_type = 'BOOL'
+
+    def compute(self, a, b):
+        return a < b
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        left = Node("expression")
-        right = Node("expression")
-        node.children.extend([left, Node("<"), right])
+        left = right = None
+        if node is not None:
+            left = Node("expression")
+            right = Node("expression")
+            node.children.extend([left, Node("<"), right])
         eval_left = self.left.eval(left, builder=builder)
         eval_right = self.right.eval(right, builder=builder)
-        if eval_left.type == ir.FloatType():
+        if self.operand_type == 'FLT':
             i = builder.fcmp_ordered('<', eval_left, eval_right)
         else:
             i = builder.icmp_signed('<', eval_left, eval_right)
@@ -778,16 +1195,23 @@ class LessThan(BinaryOp):
 
 
 class GreaterThanEqual(BinaryOp):
+    result_type = 'BOOL'
+
+    def compute(self, a, b):
+        return a >= b
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        left = Node("expression")
-        right = Node("expression")
-        node.children.extend([left, Node(">="), right])
+        left = right = None
+        if node is not None:
+            left = Node("expression")
+            right = Node("expression")
+            node.children.extend([left, Node(">="), right])
         eval_left = self.left.eval(left, builder=builder)
         eval_right = self.right.eval(right, builder=builder)
-        if eval_left.type == ir.FloatType():
+        if self.operand_type == 'FLT':
             i = builder.fcmp_ordered('>=', eval_left, eval_right)
         else:
             i = builder.icmp_signed('>=', eval_left, eval_right)
@@ -795,50 +1219,142 @@ class GreaterThanEqual(BinaryOp):
 
 
 class LessThanEqual(BinaryOp):
+    result_type = 'BOOL'
+
+    def compute(self, a, b):
+        return a <= b
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        left = Node("expression")
-        right = Node("expression")
-        node.children.extend([left, Node("<="), right])
+        left = right = None
+        if node is not None:
+            left = Node("expression")
+            right = Node("expression")
+            node.children.extend([left, Node("<="), right])
         eval_left = self.left.eval(left, builder=builder)
         eval_right = self.right.eval(right, builder=builder)
-        if eval_left.type == ir.FloatType():
+        if self.operand_type == 'FLT':
             i = builder.fcmp_ordered('<=', eval_left, eval_right)
         else:
             i = builder.icmp_signed('<=', eval_left, eval_right)
         return i
 
 
-class And(BinaryOp):
-    def eval(self, node, builder=None):
-        if builder is None:
-            builder = self.builder
+def _is_leaf(node):
+    while isinstance(node, ExpressParenthesis):
+        node = node.expression
+    return isinstance(node, (Constant, Variable))
+
+
+def _is_cheap(node):
+    """
+    Whether `node` is cheap enough to evaluate even when its value is not
+    needed: a constant, a variable, or one operation on those that cannot
+    trap, which rules out integer division.
+    """
+    while isinstance(node, ExpressParenthesis):
+        node = node.expression
+    if _is_leaf(node):
+        return True
+    if isinstance(node, Div) and node.operand_type == 'INT':
+        return False
+    if isinstance(node, (Additive, Not)):
+        return _is_leaf(node.value)
+    if isinstance(node, BinaryOp) and not isinstance(node, (Assignment, Logical)):
+        return _is_leaf(node.left) and _is_leaf(node.right)
+    if isinstance(node, BaseFunction):
+        return _is_leaf(node.expression) and _is_leaf(node.expression2)
+    return False
+
+
+class Logical(BinaryOp):
+    """
+    Base of `and` and `or`. On BOOL operands the right side is evaluated
+    only if the left side does not decide the result, with a branch and a
+    phi. If `branchless` is set and the right side is cheap to evaluate
+    anyway, both sides are evaluated and combined with one instruction, as
+    they always are for the bitwise form on INT operands.
+    """
+    # Value of the left side that decides the result on its own
+    short_circuit = None
+    label = None
+
+    def __init__(self, left, right, state, builder, module, branchless=True):
+        super().__init__(left, right, state, builder, module)
+        self.branchless = branchless
 
-        left = Node("expression")
-        right = Node("expression")
-        node.children.extend([left, Node("and"), right])
-        left_eval = self.left.eval(left, builder=builder)
-        right_eval = self.right.eval(right, builder=builder)
-        i = builder.and_(left_eval, right_eval)
-        return i
+    def simplify(self):
+        # A constant left side either decides the result or leaves the right
+        if self.operand_type == 'BOOL' and isinstance(self.left, Constant):
+            return self.left if bool(self.left.value) == self.short_circuit else self.right
+        return self
 
+    def combine(self, builder, left, right):
+        raise NotImplementedError
 
-class Or(BinaryOp):
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        left = Node("expression")
-        right = Node("expression")
-        node.children.extend([left, Node("or"), right])
+        left = right = None
+        if node is not None:
+            left = Node("expression")
+            right = Node("expression")
+            node.children.extend([left, Node(self.label), right])
         left_eval = self.left.eval(left, builder=builder)
+        if self.operand_type != 'BOOL' or (self.branchless and _is_cheap(self.right)):
+            right_eval = self.right.eval(right, builder=builder)
+            return self.combine(builder, left_eval, right_eval)
+
+        left_block = builder.block
+        rhs_block = builder.append_basic_block(self.label + '_rhs')
+        end_block = builder.append_basic_block(self.label + '_end')
+        if self.short_circuit:
+            builder.cbranch(left_eval, end_block, rhs_block)
+        else:
+            builder.cbranch(left_eval, rhs_block, end_block)
+
+        builder.position_at_end(rhs_block)
         right_eval = self.right.eval(right, builder=builder)
-        i = builder.or_(left_eval, right_eval)
+        # The right side may have added blocks of its own
+        rhs_block = builder.block
+        builder.branch(end_block)
+
+        builder.position_at_end(end_block)
+        i = builder.phi(ir.IntType(1))
+        i.add_incoming(ir.Constant(ir.IntType(1), self.short_circuit), left_block)
+        i.add_incoming(right_eval, rhs_block)
         return i
 
 
+class And(Logical):
+    short_circuit = False
+    label = "and"
+
+    def compute(self, a, b):
+        if self.operand_type == 'FLT':
+            return None
+        return a & b
+
+    def combine(self, builder, left, right):
+        return builder.and_(left, right)
+
+
+class Or(Logical):
+    short_circuit = True
+    label = "or"
+
+    def compute(self, a, b):
+        if self.operand_type == 'FLT':
+            return None
+        return a | b
+
+    def combine(self, builder, left, right):
+        return builder.or_(left, right)
+
+
 class Not(BaseBox):
     def __init__(self, expression, state, builder, module):
         self.value = expression
@@ -846,14 +1362,30 @@ class Not(BaseBox):
         self.builder = builder
         self.module = module
 
+    def analyze(self, scope):
+        self.type = self.value.analyze(scope)
+        return self.type
+
+    def fold(self):
+        self.value = self.value.fold()
+        if isinstance(self.value, Constant) and self.type in ('INT', 'BOOL'):
+            # not_ flips every bit
+            value = 1 - self.value.value if self.type == 'BOOL' else ~self.value.value
+            return _constant(self.type, value, self.state, self.builder, self.module)
+        if isinstance(self.value, Not):
+            return self.value.value
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        expression = Node("expression")
-        node.children.extend([Node("Not"), expression])
-        self.value = self.value.eval(expression, builder=builder)
-        i = builder.not_(self.value)
+        expression = None
+        if node is not None:
+            expression = Node("expression")
+            node.children.extend([Node("Not"), expression])
+        value = self.value.eval(expression, builder=builder)
+        i = builder.not_(value)
         return i
 
 
@@ -865,23 +1397,36 @@ class Print(BaseBox):
         self.value = expression
         self.state = state
 
+    def analyze(self, scope):
+        if self.value is not None:
+            self.value.analyze(scope)
+
+    def fold(self):
+        if self.value is not None:
+            self.value = self.value.fold()
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        node.children.extend([Node("PRINT"), Node("(")])
+        if node is not None:
+            node.children.extend([Node("PRINT"), Node("(")])
         if self.value is None:
             print()
         else:
-            expression = Node("expression")
-            node.children.extend([expression])
+            expression = None
+            if node is not None:
+                expression = Node("expression")
+                node.children.extend([expression])
             value = self.value.eval(expression, builder=builder)
 
             voidptr_ty = ir.IntType(32).as_pointer()
             fmt_arg = builder.bitcast(global_fmt, voidptr_ty)
 
             builder.call(self.printf, [fmt_arg, value])
-        node.children.extend([Node(")")])
+        if node is not None:
+            node.children.extend([Node(")")])
 
 
 class Input(BaseBox):
@@ -890,14 +1435,18 @@ class Input(BaseBox):
         self.state = state
 
     def eval(self, node):
-        node.children.extend([Node("CONSOLE_INPUT"), Node("(")])
+        if node is not None:
+            node.children.extend([Node("CONSOLE_INPUT"), Node("(")])
         if self.value is None:
             result = input()
         else:
-            expression = Node("expression")
-            node.children.extend([expression])
+            expression = None
+            if node is not None:
+                expression = Node("expression")
+                node.children.extend([expression])
             result = input(self.value.eval(expression))
-        node.children.extend([Node(")")])
+        if node is not None:
+            node.children.extend([Node(")")])
         import re as regex
         if regex.search('^-?\d+(\.\d+)?$', str(result)):
             return float(result)
@@ -921,51 +1470,34 @@ class Main(BaseBox):
         global_fmt.global_constant = True
         global_fmt.initializer = c_fmt
 
-        flt = ir.FloatType()
-        int_ = ir.IntType(32)
-
-        fnty = ir.FunctionType(int_, (int_, int_))
-        func = ir.Function(self.module, fnty, name="sum")
-        fnctns['sum'] = func
-        block = func.append_basic_block(name="entry")
-        f_builder = ir.IRBuilder(block)
-        a, b = func.args
-        result = f_builder.add(a, b, name="res")
-        f_builder.ret(result)
-
-        fnty = ir.FunctionType(flt, (flt, flt))
-        func = ir.Function(self.module, fnty, name="fsum")
-        fnctns['sumf'] = func
-        block = func.append_basic_block(name="entry")
-        f_builder = ir.IRBuilder(block)
-        a, b = func.args
-        result = f_builder.fadd(a, b, name="res")
-        f_builder.ret(result)
-
-        fnty = ir.FunctionType(int_, (int_, int_))
-        func = ir.Function(self.module, fnty, name="sub")
-        fnctns['sub'] = func
-        block = func.append_basic_block(name="entry")
-        f_builder = ir.IRBuilder(block)
-        a, b = func.args
-        result = f_builder.sub(a, b, name="res")
-        f_builder.ret(result)
-
-        fnty = ir.FunctionType(flt, (flt, flt))
-        func = ir.Function(self.module, fnty, name="fsub")
-        fnctns['subf'] = func
-        block = func.append_basic_block(name="entry")
-        f_builder = ir.IRBuilder(block)
-        a, b = func.args
-        result = f_builder.fsub(a, b, name="res")
-        f_builder.ret(result)
+    def analyze(self, state):
+        """
+        Resolves names and checks types in the whole program, recording the
+        scope of the top-level code and of every function in `state.scopes`.
+        """
+        self.scope = FunctionScope('main')
+        state.scopes.append(self.scope)
+        self.program.analyze(self.scope)
+
+    def fold(self):
+        """
+        Folds constant subexpressions and applies algebraic identities
+        throughout the analyzed program before code is generated.
+        """
+        self.program.fold()
+        return self
 
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        program = Node("program")
-        node.children.extend([program])
+        _allocate(self.scope, builder.function)
+        # The allocas went in ahead of the builder's insertion point
+        builder.position_at_end(builder.block)
+        program = None
+        if node is not None:
+            program = Node("program")
+            node.children.extend([program])
         return self.program.eval(program, builder=builder)
 
 
@@ -975,12 +1507,20 @@ class ExpressParenthesis(BaseBox):
         self.builder = builder
         self.module = module
 
+    def analyze(self, scope):
+        return self.expression.analyze(scope)
+
+    def fold(self):
+        return self.expression.fold()
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        expression = Node("expression")
-        node.children.extend([Node("("), expression, Node(")")])
+        expression = None
+        if node is not None:
+            expression = Node("expression")
+            node.children.extend([Node("("), expression, Node(")")])
         return self.expression.eval(expression, builder=builder)
 
 
@@ -990,12 +1530,21 @@ class StatementFull(BaseBox):
         self.builder = builder
         self.module = module
 
+    def analyze(self, scope):
+        return self.statement.analyze(scope)
+
+    def fold(self):
+        self.statement.fold()
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        statement = Node("statement")
-        node.children.extend([statement, Node(";")])
+        statement = None
+        if node is not None:
+            statement = Node("statement")
+            node.children.extend([statement, Node(";")])
         return self.statement.eval(statement, builder=builder)
 
 
@@ -1005,10 +1554,19 @@ class Statement(BaseBox):
         self.builder = builder
         self.module = module
 
+    def analyze(self, scope):
+        return self.expression.analyze(scope)
+
+    def fold(self):
+        self.expression = self.expression.fold()
+        return self
+
     def eval(self, node, builder=None):
         if builder is None:
             builder = self.builder
 
-        expression = Node("expression")
-        node.children.extend([expression])
+        expression = None
+        if node is not None:
+            expression = Node("expression")
+            node.children.extend([expression])
         return self.expression.eval(expression, builder=builder)
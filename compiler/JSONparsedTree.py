@@ -40,7 +40,82 @@ def serialize(obj):
         return None
 
 
-def write(root: Node, filename: str):
-    data = json.dumps(ParsedTree(root), default=serialize)
+# Right-recursive rules whose nodes the compact mode flattens into one array
+CHAINS = frozenset(['program', 'block', 'args', 'args_call'])
+
+_END = object()
+_encode_scalar = json.JSONEncoder().encode
+
+
+def _is_node(obj):
+    return hasattr(obj, 'text') and hasattr(obj, 'children')
+
+
+def _chain(node):
+    """Children of `node` with the trailing nodes of the same rule spliced in"""
+    children = node.children
+    while (children and _is_node(children[-1]) and children[-1].text == node.text
+           and isinstance(children[-1].children, list)):
+        yield from children[:-1]
+        children = children[-1].children
+    yield from children
+
+
+def iterencode(obj, compact=False):
+    """
+    Yields the JSON text of `obj` in pieces, encoding nodes as serialize()
+    does but with an explicit stack instead of recursion, so that deep trees
+    neither hit the recursion limit nor have to be held as one string.
+    """
+    stack = [(iter((obj,)), '')]
+    first = True
+    while stack:
+        items, close = stack[-1]
+        item = next(items, _END)
+        if item is _END:
+            stack.pop()
+            yield close
+            first = False
+            continue
+        if not first:
+            yield ', '
+        first = False
+        if type(item) == ParsedTree:
+            yield '{"parsedTree": '
+            stack.append((iter((item.nodeStructure,)), '}'))
+            first = True
+        elif isinstance(item, (list, tuple)):
+            yield '['
+            stack.append((iter(item), ']'))
+            first = True
+        elif isinstance(item, (str, int, float)) or item is None:
+            yield _encode_scalar(item)
+        elif _is_node(item):
+            if compact and item.text in CHAINS and isinstance(item.children, list):
+                yield '{%s: [' % _encode_scalar(str(item.text))
+                stack.append((_chain(item), ']}'))
+            else:
+                yield '{%s: ' % _encode_scalar(str(item.text))
+                stack.append((iter((item.children,)), '}'))
+            first = True
+        else:
+            yield 'null'
+
+
+def write(root: Node, filename: str, compact=False, chunk_size=1 << 16):
+    """
+    Writes the tree under `root` to treant-js-master/<filename>.json in
+    chunks of about `chunk_size` characters. With `compact`, the chains of
+    CHAINS nodes are written as one array of their items.
+    """
     with open('treant-js-master/%s.json' % filename, 'w') as f:
-        f.write(data)
+        chunk = []
+        size = 0
+        for piece in iterencode(ParsedTree(root), compact):
+            chunk.append(piece)
+            size += len(piece)
+            if size >= chunk_size:
+                f.write(''.join(chunk))
+                chunk = []
+                size = 0
+        f.write(''.join(chunk))
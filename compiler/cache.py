@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+import tempfile
+
+import llvmlite
+from appdirs import AppDirs
+from llvmlite import binding
+
+STATS_FILE = 'stats.json'
+
+_fingerprint = None
+
+
+def compiler_fingerprint():
+    """
+    Hash of the sources of the compiler and of rply, and of the llvmlite
+    and LLVM versions. Any change to them gives the cache new keys.
+    """
+    global _fingerprint
+    if _fingerprint is None:
+        digest = hashlib.sha256()
+        digest.update(('%s %s' % (llvmlite.__version__, binding.llvm_version_info)).encode())
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        for package in ('compiler', 'rply'):
+            directory = os.path.join(root, package)
+            for name in sorted(os.listdir(directory)):
+                if name.endswith('.py'):
+                    digest.update(name.encode())
+                    with open(os.path.join(directory, name), 'rb') as f:
+                        digest.update(f.read())
+        _fingerprint = digest.hexdigest()
+    return _fingerprint
+
+
+class CompileCache:
+    """
+    Compiled outputs on disk, one file per key, keyed by a hash of the
+    source text, the compiler fingerprint and the options that change the
+    output. Reading an entry marks it as recently used, and writing one
+    evicts the least recently used entries until the cache holds at most
+    `max_size` bytes. Counts of hits, misses and evictions are kept in
+    stats.json next to the entries.
+
+    The cache is only an optimization: a directory that cannot be written
+    to leaves every lookup a miss.
+    """
+    def __init__(self, cache_dir=None, max_size=256 << 20):
+        if cache_dir is None:
+            cache_dir = AppDirs("compiler").user_cache_dir
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+    def key(self, source, **options):
+        """Key of `source` (str or bytes) compiled with `options`"""
+        digest = hashlib.sha256(compiler_fingerprint().encode())
+        digest.update(json.dumps(options, sort_keys=True).encode())
+        digest.update(source.encode() if isinstance(source, str) else source)
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def get(self, key):
+        """The cached bytes of `key`, or None on a miss"""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            self._count('misses')
+            return None
+        self._count('hits')
+        return data
+
+    def _write(self, name, data, mode='wb'):
+        # Written to a temporary file and renamed, so readers never see
+        # a partial entry
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir, mode=0o0700)
+        with tempfile.NamedTemporaryFile(mode, dir=self.cache_dir, prefix='.', delete=False) as f:
+            f.write(data)
+        os.replace(f.name, os.path.join(self.cache_dir, name))
+
+    def put(self, key, data):
+        try:
+            self._write(key, data)
+            self._evict()
+        except OSError:
+            return
+
+    def _evict(self):
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name == STATS_FILE or entry.name.startswith('.') or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        entries.sort()
+        evicted = 0
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            os.remove(path)
+            total -= size
+            evicted += 1
+        if evicted:
+            self._count('evictions', evicted)
+
+    def stats(self):
+        """Counts of hits, misses and evictions since the cache was created"""
+        stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        try:
+            with open(os.path.join(self.cache_dir, STATS_FILE)) as f:
+                stats.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+        return stats
+
+    def _count(self, name, n=1):
+        stats = self.stats()
+        stats[name] += n
+        try:
+            self._write(STATS_FILE, json.dumps(stats), mode='w')
+        except OSError:
+            return
@@ -1,15 +1,82 @@
+import ctypes
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
 from llvmlite import ir, binding
 
 
+def _load_libc():
+    """The C library that is already loaded into this process"""
+    if sys.platform == 'win32':
+        return ctypes.cdll.msvcrt
+    return ctypes.CDLL(None)
+
+
+def target_cpu(cpu, features):
+    """
+    The cpu name and features to build for, with the cpu 'host' replaced
+    by the name of this machine's CPU and, unless `features` names them,
+    all of its features.
+    """
+    if cpu == 'host':
+        cpu = binding.get_host_cpu_name()
+        if not features:
+            features = binding.get_host_cpu_features().flatten()
+    return cpu, features
+
+
+def default_linker():
+    """The C compiler that links executables: $CC, or cc on the PATH"""
+    linker = os.environ.get('CC', 'cc')
+    return shutil.which(linker) or linker
+
+
 class CodeGen:
-    def __init__(self):
+    def __init__(self, opt_level=0, cpu='', features='', reloc='pic', code_model='default',
+                 vectorize=True, unroll_count=None, vectorize_width=None, interleave_count=None):
+        """
+        `cpu` and `features` configure the target machines of both the JIT
+        and the emitted object code, `reloc` and `code_model` only the
+        latter; the JIT keeps LLVM's defaults for in-memory code. Position
+        independent code links into the PIE executables cc builds by default.
+        The cpu 'host' stands for the CPU this runs on, with all of its
+        features unless `features` names them. With `vectorize`, -O2 and -O3
+        run the loop and SLP vectorizers.
+
+        `unroll_count`, `vectorize_width` and `interleave_count` are added to
+        the llvm.loop metadata of every loop as llvm.loop.unroll.count,
+        llvm.loop.vectorize.width and llvm.loop.interleave.count, in place
+        of the optimizer's own choice. By default no hint is set; LLVM warns
+        about each loop it cannot unroll as requested.
+        """
+        self.opt_level = opt_level
+        self.cpu, self.features = target_cpu(cpu, features)
+        self.vectorize = vectorize
+        self.loop_hints = tuple((name, value) for name, value in (
+            ('llvm.loop.unroll.count', unroll_count),
+            ('llvm.loop.vectorize.width', vectorize_width),
+            ('llvm.loop.interleave.count', interleave_count)) if value is not None)
+        self.reloc = reloc
+        self.code_model = code_model
+        self.optimized_module = None
+        self.compiled_module = None
+        self.llvm_ir = None
+        self.timings = {}
+        self._jitted = False
         self.binding = binding
         self.binding.initialize()
         self.binding.initialize_native_target()
         self.binding.initialize_native_asmprinter()
         self._config_llvm()
         self._create_execution_engine()
+        self._create_emit_machine()
         self._declare_print_function()
+        self._resolve_runtime()
 
     def _config_llvm(self):
         self.module = ir.Module(name=__file__)
@@ -23,37 +90,181 @@ class CodeGen:
         """
         Create an ExecutionEngine suitable for JIT code generation on
         the host CPU.  The engine is reusable for an arbitrary number of
-        modules.
+        modules. The module takes the data layout of its target machine.
         """
         target = self.binding.Target.from_default_triple()
-        target_machine = target.create_target_machine()
+        target_machine = target.create_target_machine(
+            cpu=self.cpu, features=self.features, opt=self.opt_level,
+            codemodel='jitdefault')
+        self.module.data_layout = str(target_machine.target_data)
         backing_mod = binding.parse_assembly("")
         engine = binding.create_mcjit_compiler(backing_mod, target_machine)
+        self.target_machine = target_machine
         self.engine = engine
 
+    def _create_emit_machine(self):
+        """
+        The target machine for object code and assembly written to disk,
+        with the relocation and code models given to the constructor.
+        """
+        target = self.binding.Target.from_default_triple()
+        self.emit_machine = target.create_target_machine(
+            cpu=self.cpu, features=self.features, opt=self.opt_level,
+            reloc=self.reloc, codemodel=self.code_model)
+
     def _declare_print_function(self):
         voidptr_ty = ir.IntType(32).as_pointer()
         printf_ty = ir.FunctionType(ir.IntType(32), [voidptr_ty], var_arg=True)
         printf = ir.Function(self.module, printf_ty, name="printf")
         self.printf = printf
 
+    def _resolve_runtime(self):
+        """
+        Point the JIT at printf of the C library, so that run() needs neither
+        a linker nor an executable on disk.
+        """
+        self.libc = _load_libc()
+        self.binding.add_symbol('printf', ctypes.cast(self.libc.printf, ctypes.c_void_p).value)
+
+    def _optimize(self, mod):
+        """
+        Run the standard -O<opt_level> function and module pipelines (mem2reg,
+        instcombine, GVN, loop passes, inlining and vectorization from -O2)
+        over the module.
+        """
+        pmb = self.binding.PassManagerBuilder()
+        pmb.opt_level = self.opt_level
+        if self.opt_level >= 2:
+            pmb.inlining_threshold = 275 if self.opt_level >= 3 else 225
+            pmb.loop_vectorize = self.vectorize
+            pmb.slp_vectorize = self.vectorize
+        fpm = self.binding.FunctionPassManager(mod)
+        mpm = self.binding.ModulePassManager()
+        self.target_machine.add_analysis_passes(fpm)
+        self.target_machine.add_analysis_passes(mpm)
+        pmb.populate(fpm)
+        pmb.populate(mpm)
+        fpm.initialize()
+        for function in mod.functions:
+            fpm.run(function)
+        fpm.finalize()
+        mpm.run(mod)
+
+    @contextmanager
+    def phase(self, name):
+        """Adds the time spent in the with-block to timings[name]"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+    def _add_loop_hints(self):
+        """Appends loop_hints to the llvm.loop node of every loop"""
+        hints = tuple(self.module.add_metadata([ir.MetaDataString(self.module, name),
+                                                ir.Constant(ir.IntType(32), value)])
+                      for name, value in self.loop_hints)
+        for function in self.module.functions:
+            for block in function.blocks:
+                loop_id = block.terminator.metadata.get('llvm.loop') if block.terminator else None
+                if loop_id is not None:
+                    loop_id.operands = loop_id.operands + hints
+
     def _compile_ir(self):
         """
-        Compile the LLVM IR string with the given engine.
+        Render the module to LLVM IR once, keeping the text in `llvm_ir` for
+        save_ir(), then parse and verify it, optimizing it unless opt_level
+        is 0. Machine code is generated only when it is asked for, by run()
+        or the emit methods.
         The compiled module object is returned.
         """
         self.builder.ret_void()
-        llvm_ir = str(self.module)
-        mod = self.binding.parse_assembly(llvm_ir)
-        mod.verify()
-        self.engine.add_module(mod)
-        self.engine.finalize_object()
-        self.engine.run_static_constructors()
+        if self.loop_hints:
+            self._add_loop_hints()
+        with self.phase('render_ir'):
+            self.llvm_ir = str(self.module)
+        with self.phase('parse_ir'):
+            mod = self.binding.parse_assembly(self.llvm_ir)
+        with self.phase('verify'):
+            mod.verify()
+        if self.opt_level:
+            with self.phase('optimize'):
+                self._optimize(mod)
+            self.optimized_module = mod
+        self.compiled_module = mod
         return mod
 
+    def _jit(self):
+        if not self._jitted:
+            self.engine.add_module(self.compiled_module)
+            self.engine.finalize_object()
+            self.engine.run_static_constructors()
+            self._jitted = True
+
     def create_ir(self):
         self._compile_ir()
 
+    def run(self):
+        """
+        Call main() of the module compiled by create_ir() in this process.
+        Both Python's and the C library's buffered stdout are flushed, so the
+        program's output is not interleaved with the compile log.
+        """
+        with self.phase('jit'):
+            self._jit()
+        main = ctypes.CFUNCTYPE(None)(self.engine.get_function_address("main"))
+        sys.stdout.flush()
+        main()
+        self.libc.fflush(None)
+
+    def emit_object(self, filename):
+        """Write the native object code of the module compiled by create_ir()"""
+        with self.phase('emit'):
+            obj = self.emit_machine.emit_object(self.compiled_module)
+        with self.phase('write'), open(filename, 'wb') as output_file:
+            output_file.write(obj)
+
+    def emit_assembly(self, filename):
+        """Write the native assembly of the module compiled by create_ir()"""
+        with self.phase('emit'):
+            asm = self.emit_machine.emit_assembly(self.compiled_module)
+        with self.phase('write'), open(filename, 'w') as output_file:
+            output_file.write(asm)
+
+    def emit_executable(self, filename, linker=None):
+        """
+        Write an executable of the module compiled by create_ir(). The object
+        code goes to a temporary file, and the C compiler named by `linker`,
+        $CC or cc links it against the C library in a single call.
+        """
+        linker = linker or default_linker()
+        with tempfile.TemporaryDirectory() as tmp:
+            obj = os.path.join(tmp, os.path.basename(filename) + '.o')
+            self.emit_object(obj)
+            with self.phase('link'):
+                subprocess.check_call([linker, obj, '-o', filename])
+
     def save_ir(self, filename):
-        with open(filename, 'w') as output_file:
-            output_file.write(str(self.module))
\ No newline at end of file
+        """
+        Write the IR of the module, optimized if create_ir() has optimized it.
+        Unoptimized IR reuses the text that create_ir() rendered.
+        """
+        with self.phase('render_ir'):
+            if self.optimized_module is not None:
+                llvm_ir = str(self.optimized_module)
+            elif self.llvm_ir is not None:
+                llvm_ir = self.llvm_ir
+            else:
+                llvm_ir = str(self.module)
+        with self.phase('write'), open(filename, 'w') as output_file:
+            output_file.write(llvm_ir)
+
+    def save_bitcode(self, filename):
+        """
+        Write the module compiled by create_ir() as LLVM bitcode, which
+        llc, clang and parse_bitcode() read without parsing text.
+        """
+        with self.phase('bitcode'):
+            bitcode = self.compiled_module.as_bitcode()
+        with self.phase('write'), open(filename, 'wb') as output_file:
+            output_file.write(bitcode)
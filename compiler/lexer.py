@@ -1,6 +1,36 @@
+import mmap
+import os
+from types import MappingProxyType
+
 from rply import LexerGenerator
 
 
+# Reserved words are lexed as identifiers and then renamed through this table.
+KEYWORDS = MappingProxyType({
+    # Binary Operator
+    'and': 'AND',
+    'or': 'OR',
+    # Statement
+    'if': 'IF',
+    'else': 'ELSE',
+    'not': 'NOT',
+    'while': 'WHILE',
+    'break': 'BREAK',
+    'continue': 'CONTINUE',
+    # Function
+    'print': 'PRINT',
+    'sum': 'SUMI',
+    'sumf': 'SUMF',
+    'sub': 'SUBI',
+    'subf': 'SUBF',
+    'def': 'FUNC',
+    'return': 'RETURN',
+    # Assignment
+    'int': 'INT',
+    'float': 'FLT',
+})
+
+
 class Lexer:
     def __init__(self):
         self.lexer = LexerGenerator()
@@ -16,8 +46,6 @@ class Lexer:
         self.lexer.add('MUL', r'\*')
         self.lexer.add('DIV', r'\/')
         # Binary Operator
-        self.lexer.add('AND', r'and(?!\w)')
-        self.lexer.add('OR', r'or(?!\w)')
         self.lexer.add('==', r'\=\=')
         self.lexer.add('!=', r'\!\=')
         self.lexer.add('>=', r'\>\=')
@@ -25,13 +53,6 @@ class Lexer:
         self.lexer.add('>', r'\>')
         self.lexer.add('<', r'\<')
         self.lexer.add('=', r'\=')
-        # Statement
-        self.lexer.add('IF', r'if(?!\w)')
-        self.lexer.add('ELSE', r'else(?!\w)')
-        self.lexer.add('NOT', r'not(?!\w)')
-        self.lexer.add('WHILE', r'while(?!\w)')
-        self.lexer.add('BREAK', r'break(?!\w)')
-        self.lexer.add('CONTINUE', r'continue(?!\w)')
         # Semi Colon
         self.lexer.add(';', r'\;')
         self.lexer.add(',', r'\,')
@@ -40,22 +61,23 @@ class Lexer:
         self.lexer.add(')', r'\)')
         self.lexer.add('{', r'\{')
         self.lexer.add('}', r'\}')
-        # Function
-        self.lexer.add('PRINT', r'print')
-        self.lexer.add('SUMI', r'sum(?!\w)')
-        self.lexer.add('SUMF', r'sumf(?!\w)')
-        self.lexer.add('SUBI', r'sub(?!\w)')
-        self.lexer.add('SUBF', r'subf(?!\w)')
-        self.lexer.add('FUNC', r'def(?!\w)')
-        self.lexer.add('RETURN', r'return(?!\w)')
-        # Assignment
-        self.lexer.add('INT', r'int(?!\w)')
-        self.lexer.add('FLT', r'float(?!\w)')
-        self.lexer.add('IDENTIFIER', "[a-zA-Z_][a-zA-Z0-9_]*")
+        # Identifiers and reserved words
+        self.lexer.add('IDENTIFIER', "[a-zA-Z_][a-zA-Z0-9_]*", keywords=KEYWORDS)
         # Ignore spaces
         self.lexer.ignore('\/\/.*')
         self.lexer.ignore('\/[*](.|\n)*[*]\/')
         self.lexer.ignore('\s+')
 
     def build(self):
-        return self.lexer.build()
+        return self.lexer.build(master=True)
+
+
+def map_source(filename):
+    """
+    Maps a source file into memory for lexing without reading it as a whole.
+    The result can be passed to the lexer in place of the source string.
+    """
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
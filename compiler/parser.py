@@ -1,3 +1,5 @@
+import os
+
 from rply import ParserGenerator
 from compiler.JSONparsedTree import Node
 from compiler.AbstractSyntaxTree import *
@@ -6,14 +8,18 @@ from compiler.errors import *
 
 class ParserState(object):
     def __init__(self):
-        self.variables = {}
+        self.scopes = []
         self.functions = {}
-        self.while_body = []
+        self.while_cond = []
         self.while_end = []
 
 
 class Parser:
-    def __init__(self, module, builder, printf, syntax=False):
+    def __init__(self, module, builder, printf, syntax=False, cache_dir=None, branchless=True):
+        # The LALR tables are cached on disk under cache_dir (by default the
+        # user's cache directory), keyed by a hash of the grammar. With
+        # branchless, and/or on booleans whose right side is cheap evaluate
+        # both sides instead of branching.
         self.pg = ParserGenerator(
             ['INTEGER', 'FLOAT',
              '(', ')', ',', ';', '{', '}',
@@ -37,11 +43,14 @@ class Parser:
                 ('left', ['SUM', 'SUB']),
                 ('left', ['MUL', 'DIV']),
                 ('left', ['STRING', 'INTEGER', 'FLOAT', 'BOOLEAN'])
-            )
+            ),
+            cache_id='compiler',
+            cache_dir=cache_dir
         )
         self.builder = builder
         self.module = module
         self.printf = printf
+        self.branchless = branchless
         self.syntax = syntax
         self.parse()
 
@@ -263,11 +272,11 @@ class Parser:
             elif p[1].gettokentype() == 'AND':
                 if self.syntax is True:
                     return [Node("expression", p[0]), Node("AND"), Node("expression", p[2])]
-                return And(p[0], p[2], state, self.builder, self.module)
+                return And(p[0], p[2], state, self.builder, self.module, branchless=self.branchless)
             elif p[1].gettokentype() == 'OR':
                 if self.syntax is True:
                     return [Node("expression", p[0]), Node("OR"), Node("expression", p[2])]
-                return Or(p[0], p[2], state, self.builder, self.module)
+                return Or(p[0], p[2], state, self.builder, self.module, branchless=self.branchless)
             else:
                 raise LogicError("Unknown operator: %s" % p[1].gettokentype())
 
@@ -360,4 +369,14 @@ class Parser:
             raise ValueError(token)
 
     def build(self):
-        return self.pg.build()
+        # compiler/parsetab.py holds tables generated ahead of time by running
+        # this module; without it the tables are built (or read from cache).
+        try:
+            from compiler import parsetab
+        except ImportError:
+            parsetab = None
+        return self.pg.build(dense=True, tables=parsetab)
+
+
+if __name__ == '__main__':
+    Parser(None, None, None).pg.write_tables(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parsetab.py'))
@@ -0,0 +1,677 @@
+# Parse tables generated by rply from the grammar below. Do not
+# edit; regenerate them with ParserGenerator.write_tables().
+from array import array
+
+VERSION = 2
+GRAMMAR_HASH = '9c05883c10f31bb4e6373751f65e394126ec5681'
+
+TERMINALS = ['!=', '(', ')', ',', ';', '<', '<=', '=', '==', '>', '>=', 'AND', 'BREAK', 'CONTINUE', 'DIV', 'ELSE', 'FLOAT', 'FLT', 'FUNC', 'IDENTIFIER', 'IF', 'INT', 'INTEGER', 'MUL', 'NOT', 'OR', 'PRINT', 'RETURN', 'SUB', 'SUBF', 'SUBI', 'SUM', 'SUMF', 'SUMI', 'WHILE', 'error', '{', '}', '$end']
+NONTERMINALS = ['arg', 'args', 'args_call', 'block', 'const', 'expression', 'main', 'program', 'statement', 'statement_full']
+
+# Production number -> (left-hand side, right-hand side). Reducing
+# production n calls the n-th function registered with
+# ParserGenerator.production(); number 0 is the start production.
+PRODUCTIONS = [
+    ("S'", ['main']),
+    ('main', ['program']),
+    ('program', ['statement_full']),
+    ('program', ['statement_full', 'program']),
+    ('expression', ['(', 'expression', ')']),
+    ('statement_full', ['IF', '(', 'expression', ')', '{', 'block', '}']),
+    ('statement_full', ['IF', '(', 'expression', ')', '{', 'block', '}', 'ELSE', '{', 'block', '}']),
+    ('block', ['statement_full']),
+    ('block', ['statement_full', 'block']),
+    ('statement_full', ['WHILE', '(', 'expression', ')', '{', 'block', '}']),
+    ('statement_full', ['statement', ';']),
+    ('statement', ['expression']),
+    ('statement', ['BREAK']),
+    ('statement', ['CONTINUE']),
+    ('statement', ['RETURN']),
+    ('statement', ['RETURN', '(', 'expression', ')']),
+    ('statement', ['FLT', 'IDENTIFIER', '=', 'expression']),
+    ('statement', ['INT', 'IDENTIFIER', '=', 'expression']),
+    ('statement', ['IDENTIFIER', '=', 'expression']),
+    ('statement_full', ['FUNC', 'FLT', 'IDENTIFIER', '(', 'args', ')', '{', 'block', '}']),
+    ('statement_full', ['FUNC', 'INT', 'IDENTIFIER', '(', 'args', ')', '{', 'block', '}']),
+    ('arg', ['FLT', 'IDENTIFIER']),
+    ('arg', ['INT', 'IDENTIFIER']),
+    ('args', ['arg']),
+    ('args', ['arg', ',', 'args']),
+    ('expression', ['NOT', 'expression']),
+    ('expression', ['expression', 'DIV', 'expression']),
+    ('expression', ['expression', 'MUL', 'expression']),
+    ('expression', ['expression', 'SUB', 'expression']),
+    ('expression', ['expression', 'SUM', 'expression']),
+    ('expression', ['SUB', 'expression']),
+    ('expression', ['expression', 'OR', 'expression']),
+    ('expression', ['expression', 'AND', 'expression']),
+    ('expression', ['expression', '<', 'expression']),
+    ('expression', ['expression', '>', 'expression']),
+    ('expression', ['expression', '<=', 'expression']),
+    ('expression', ['expression', '>=', 'expression']),
+    ('expression', ['expression', '==', 'expression']),
+    ('expression', ['expression', '!=', 'expression']),
+    ('statement', ['PRINT', '(', ')']),
+    ('statement', ['PRINT', '(', 'expression', ')']),
+    ('expression', ['IDENTIFIER']),
+    ('expression', ['IDENTIFIER', '(', 'args_call', ')']),
+    ('expression', ['IDENTIFIER', '(', ')']),
+    ('args_call', ['expression']),
+    ('args_call', ['expression', ',', 'args_call']),
+    ('expression', ['SUMI', '(', 'expression', ',', 'expression', ')']),
+    ('expression', ['SUMF', '(', 'expression', ',', 'expression', ')']),
+    ('expression', ['SUBI', '(', 'expression', ',', 'expression', ')']),
+    ('expression', ['SUBF', '(', 'expression', ',', 'expression', ')']),
+    ('expression', ['const']),
+    ('const', ['FLOAT']),
+    ('const', ['INTEGER']),
+]
+
+ACTION = array("i", [
+    -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    5, 17, -2147483648, -2147483648, 12, 4, 2, 8, 3, 22, 18, -2147483648,
+    21, -2147483648, 15, 19, 14, 6, 20, -2147483648, 13, 7, 9, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, 5, 17, -2147483648, -2147483648, 12, 4, 2, 8, 3,
+    22, 18, -2147483648, 21, -2147483648, 15, 19, 14, 6, 20, -2147483648, 13,
+    7, 9, -2147483648, -2147483648, -2147483648, -2, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 28,
+    -2147483648, -2147483648, -2147483648, 27, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 29, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 30, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -12, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 31, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 32, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -41, 34, -2147483648, -2147483648, -41, -41, -41, 33, -41, -41, -41, -41,
+    -2147483648, -2147483648, -41, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -41,
+    -2147483648, -41, -2147483648, -2147483648, -41, -2147483648, -2147483648, -41, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 35, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 41, -2147483648, -2147483648, -2147483648, -11, 44,
+    40, -2147483648, 37, 46, 38, 47, -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39, -2147483648, 45, -2147483648, -2147483648, 42, -2147483648,
+    -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -50, -2147483648, -50,
+    -50, -50, -50, -50, -2147483648, -50, -50, -50, -50, -2147483648, -2147483648, -50,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -50, -2147483648, -50, -2147483648,
+    -2147483648, -50, -2147483648, -2147483648, -50, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -51, -2147483648, -51, -51, -51, -51, -51, -2147483648, -51, -51, -51, -51,
+    -2147483648, -2147483648, -51, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -51,
+    -2147483648, -51, -2147483648, -2147483648, -51, -2147483648, -2147483648, -51, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 48, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648,
+    -2147483648, 49, -2147483648, -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6,
+    20, -2147483648, 13, 7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 51, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 0, -2147483648, -2147483648, -2147483648, -2147483648, -13, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -52, -2147483648, -52, -52, -52, -52,
+    -52, -2147483648, -52, -52, -52, -52, -2147483648, -2147483648, -52, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -52, -2147483648, -52, -2147483648, -2147483648, -52, -2147483648,
+    -2147483648, -52, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 52, -2147483648,
+    -2147483648, -14, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 53, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648,
+    -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13,
+    7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 55, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 56, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -1, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648,
+    -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13,
+    7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -3, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 58, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 59, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648,
+    -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13,
+    7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 61, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 12, -2147483648, -2147483648, 49, -2147483648, -2147483648, 18, -2147483648, 21, -2147483648, -2147483648,
+    -2147483648, 14, 6, 20, -2147483648, 13, 7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648, -2147483648, 18, -2147483648,
+    21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13, 7, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648,
+    -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13,
+    7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 25, 65, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648,
+    -2147483648, 49, -2147483648, -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6,
+    20, -2147483648, 13, 7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 12, -2147483648, -2147483648, 49, -2147483648, -2147483648, 18, -2147483648, 21, -2147483648, -2147483648,
+    -2147483648, 14, 6, 20, -2147483648, 13, 7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648, -2147483648, 18, -2147483648,
+    21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13, 7, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648,
+    -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13,
+    7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648,
+    -2147483648, 49, -2147483648, -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6,
+    20, -2147483648, 13, 7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 12, -2147483648, -2147483648, 49, -2147483648, -2147483648, 18, -2147483648, 21, -2147483648, -2147483648,
+    -2147483648, 14, 6, 20, -2147483648, 13, 7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648, -2147483648, 18, -2147483648,
+    21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13, 7, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648,
+    -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13,
+    7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648,
+    -2147483648, 49, -2147483648, -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6,
+    20, -2147483648, 13, 7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 12, -2147483648, -2147483648, 49, -2147483648, -2147483648, 18, -2147483648, 21, -2147483648, -2147483648,
+    -2147483648, 14, 6, 20, -2147483648, 13, 7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648, -2147483648, 18, -2147483648,
+    21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13, 7, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648,
+    -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13,
+    7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648,
+    -2147483648, 49, -2147483648, -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6,
+    20, -2147483648, 13, 7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 12, -2147483648, -2147483648, 49, -2147483648, -2147483648, 18, -2147483648, 21, -2147483648, -2147483648,
+    -2147483648, 14, 6, 20, -2147483648, 13, 7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648, -2147483648, 18, -2147483648,
+    21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13, 7, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -41, 34, -41, -41, -41, -41, -41, -2147483648, -41,
+    -41, -41, -41, -2147483648, -2147483648, -41, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -41, -2147483648, -41, -2147483648, -2147483648, -41, -2147483648, -2147483648, -41, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -30, -2147483648, -30, -30, -30, -30,
+    -30, -2147483648, -30, -30, -30, -30, -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39, -2147483648, -30, -2147483648, -2147483648, -30, -2147483648,
+    -2147483648, -30, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 25, 82,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 12, -2147483648, -2147483648, 49, -2147483648, -2147483648, 18, -2147483648, 21, -2147483648, -2147483648,
+    -2147483648, 14, 6, 20, -2147483648, 13, 7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648, -2147483648, 18, -2147483648,
+    21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13, 7, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648,
+    -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13,
+    7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 41, -2147483648, -25, -25, -25, 44,
+    40, -2147483648, 37, 46, 38, -25, -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39, -2147483648, -25, -2147483648, -2147483648, 42, -2147483648,
+    -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 86, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -10, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -10, -10, -2147483648, -2147483648, -10, -10, -10, -10, -10, -10, -10, -2147483648,
+    -10, -2147483648, -10, -10, -10, -10, -10, -2147483648, -10, -10, -10, -2147483648,
+    -2147483648, -10, -10, 41, -2147483648, 87, -2147483648, -2147483648, 44, 40, -2147483648, 37,
+    46, 38, 47, -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 39, -2147483648, 45, -2147483648, -2147483648, 42, -2147483648, -2147483648, 36, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 88, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 89, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    41, -2147483648, 90, -2147483648, -2147483648, 44, 40, -2147483648, 37, 46, 38, 47,
+    -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39,
+    -2147483648, 45, -2147483648, -2147483648, 42, -2147483648, -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648,
+    -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13,
+    7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 41, -2147483648, -2147483648, 92, -2147483648, 44,
+    40, -2147483648, 37, 46, 38, 47, -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39, -2147483648, 45, -2147483648, -2147483648, 42, -2147483648,
+    -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 41, -2147483648, -2147483648,
+    93, -2147483648, 44, 40, -2147483648, 37, 46, 38, 47, -2147483648, -2147483648, 43,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39, -2147483648, 45, -2147483648,
+    -2147483648, 42, -2147483648, -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    41, -2147483648, -2147483648, -2147483648, -18, 44, 40, -2147483648, 37, 46, 38, 47,
+    -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39,
+    -2147483648, 45, -2147483648, -2147483648, 42, -2147483648, -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -43, -2147483648, -43, -43, -43, -43, -43, -2147483648, -43,
+    -43, -43, -43, -2147483648, -2147483648, -43, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -43, -2147483648, -43, -2147483648, -2147483648, -43, -2147483648, -2147483648, -43, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 41, -2147483648, -44, 94, -2147483648, 44,
+    40, -2147483648, 37, 46, 38, 47, -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39, -2147483648, 45, -2147483648, -2147483648, 42, -2147483648,
+    -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 95,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    41, -2147483648, 96, -2147483648, -2147483648, 44, 40, -2147483648, 37, 46, 38, 47,
+    -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39,
+    -2147483648, 45, -2147483648, -2147483648, 42, -2147483648, -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -29, -2147483648, -29, -29, -29, -29, -29, -2147483648, -29,
+    -29, -29, -29, -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 39, -2147483648, -29, -2147483648, -2147483648, -29, -2147483648, -2147483648, -29, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -37, -2147483648, -37, -37, -37, -37,
+    -37, -2147483648, -37, -37, -37, -37, -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39, -2147483648, -37, -2147483648, -2147483648, 42, -2147483648,
+    -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -36, -2147483648, -36,
+    -36, -36, -36, -36, -2147483648, -36, -36, -36, -36, -2147483648, -2147483648, 43,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39, -2147483648, -36, -2147483648,
+    -2147483648, 42, -2147483648, -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -27, -2147483648, -27, -27, -27, -27, -27, -2147483648, -27, -27, -27, -27,
+    -2147483648, -2147483648, -27, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -27,
+    -2147483648, -27, -2147483648, -2147483648, -27, -2147483648, -2147483648, -27, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -35, -2147483648, -35, -35, -35, -35, -35, -2147483648, -35,
+    -35, -35, -35, -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 39, -2147483648, -35, -2147483648, -2147483648, 42, -2147483648, -2147483648, 36, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -38, -2147483648, -38, -38, -38, -38,
+    -38, -2147483648, -38, -38, -38, -38, -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39, -2147483648, -38, -2147483648, -2147483648, 42, -2147483648,
+    -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -28, -2147483648, -28,
+    -28, -28, -28, -28, -2147483648, -28, -28, -28, -28, -2147483648, -2147483648, 43,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39, -2147483648, -28, -2147483648,
+    -2147483648, -28, -2147483648, -2147483648, -28, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -26, -2147483648, -26, -26, -26, -26, -26, -2147483648, -26, -26, -26, -26,
+    -2147483648, -2147483648, -26, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -26,
+    -2147483648, -26, -2147483648, -2147483648, -26, -2147483648, -2147483648, -26, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -33, -2147483648, -33, -33, -33, -33, -33, -2147483648, -33,
+    -33, -33, -33, -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 39, -2147483648, -33, -2147483648, -2147483648, 42, -2147483648, -2147483648, 36, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 41, -2147483648, -31, -31, -31, 44,
+    40, -2147483648, 37, 46, 38, -31, -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39, -2147483648, -31, -2147483648, -2147483648, 42, -2147483648,
+    -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -34, -2147483648, -34,
+    -34, -34, -34, -34, -2147483648, -34, -34, -34, -34, -2147483648, -2147483648, 43,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39, -2147483648, -34, -2147483648,
+    -2147483648, 42, -2147483648, -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    41, -2147483648, -32, -32, -32, 44, 40, -2147483648, 37, 46, 38, -32,
+    -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39,
+    -2147483648, -32, -2147483648, -2147483648, 42, -2147483648, -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, 41, -2147483648, -2147483648, 97, -2147483648, 44, 40, -2147483648, 37,
+    46, 38, 47, -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 39, -2147483648, 45, -2147483648, -2147483648, 42, -2147483648, -2147483648, 36, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -39, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 41, -2147483648, 98,
+    -2147483648, -2147483648, 44, 40, -2147483648, 37, 46, 38, 47, -2147483648, -2147483648, 43,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39, -2147483648, 45, -2147483648,
+    -2147483648, 42, -2147483648, -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    41, -2147483648, 99, -2147483648, -2147483648, 44, 40, -2147483648, 37, 46, 38, 47,
+    -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39,
+    -2147483648, 45, -2147483648, -2147483648, 42, -2147483648, -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, 41, -2147483648, -2147483648, 100, -2147483648, 44, 40, -2147483648, 37,
+    46, 38, 47, -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 39, -2147483648, 45, -2147483648, -2147483648, 42, -2147483648, -2147483648, 36, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648,
+    -2147483648, 49, -2147483648, -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6,
+    20, -2147483648, 13, 7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -4, -2147483648, -4,
+    -4, -4, -4, -4, -2147483648, -4, -4, -4, -4, -2147483648, -2147483648, -4,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -4, -2147483648, -4, -2147483648,
+    -2147483648, -4, -2147483648, -2147483648, -4, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 104, -2147483648, -2147483648, -2147483648, 102, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 104, -2147483648, -2147483648, -2147483648,
+    102, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 107, -2147483648, -2147483648, 41, -2147483648, -2147483648,
+    -2147483648, -16, 44, 40, -2147483648, 37, 46, 38, 47, -2147483648, -2147483648, 43,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39, -2147483648, 45, -2147483648,
+    -2147483648, 42, -2147483648, -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648, -2147483648, 18, -2147483648,
+    21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13, 7, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648,
+    -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13,
+    7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648,
+    -2147483648, 49, -2147483648, -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6,
+    20, -2147483648, 13, 7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -42, -2147483648, -42,
+    -42, -42, -42, -42, -2147483648, -42, -42, -42, -42, -2147483648, -2147483648, -42,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -42, -2147483648, -42, -2147483648,
+    -2147483648, -42, -2147483648, -2147483648, -42, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    111, -2147483648, -2147483648, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648,
+    -2147483648, 18, -2147483648, 21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13,
+    7, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -40, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -15, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 12, -2147483648, -2147483648, 49, -2147483648, -2147483648, 18, -2147483648,
+    21, -2147483648, -2147483648, -2147483648, 14, 6, 20, -2147483648, 13, 7, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, 41, -2147483648, -2147483648, -2147483648, -17, 44, 40, -2147483648, 37,
+    46, 38, 47, -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 39, -2147483648, 45, -2147483648, -2147483648, 42, -2147483648, -2147483648, 36, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 114, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -23,
+    115, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 116, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 117, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 118, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 5, 17, -2147483648,
+    -2147483648, 12, 4, 2, 8, 3, 22, 18, -2147483648, 21, -2147483648, 15,
+    19, 14, 6, 20, -2147483648, 13, 7, 9, -2147483648, -2147483648, -2147483648, -2147483648,
+    41, -2147483648, 121, -2147483648, -2147483648, 44, 40, -2147483648, 37, 46, 38, 47,
+    -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39,
+    -2147483648, 45, -2147483648, -2147483648, 42, -2147483648, -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, 41, -2147483648, 122, -2147483648, -2147483648, 44, 40, -2147483648, 37,
+    46, 38, 47, -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 39, -2147483648, 45, -2147483648, -2147483648, 42, -2147483648, -2147483648, 36, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -45, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 5, 17, -2147483648,
+    -2147483648, 12, 4, 2, 8, 3, 22, 18, -2147483648, 21, -2147483648, 15,
+    19, 14, 6, 20, -2147483648, 13, 7, 9, -2147483648, -2147483648, -2147483648, -2147483648,
+    41, -2147483648, 124, -2147483648, -2147483648, 44, 40, -2147483648, 37, 46, 38, 47,
+    -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 39,
+    -2147483648, 45, -2147483648, -2147483648, 42, -2147483648, -2147483648, 36, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, 41, -2147483648, 125, -2147483648, -2147483648, 44, 40, -2147483648, 37,
+    46, 38, 47, -2147483648, -2147483648, 43, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 39, -2147483648, 45, -2147483648, -2147483648, 42, -2147483648, -2147483648, 36, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -22, -22, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 104, -2147483648, -2147483648, -2147483648, 102, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -21, -21, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, 127, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 128, -2147483648, -2147483648, -2147483648, 25, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 5, 17, -2147483648,
+    -2147483648, 12, 4, 2, 8, 3, 22, 18, -2147483648, 21, -2147483648, 15,
+    19, 14, 6, 20, -2147483648, 13, 7, 9, -2147483648, -2147483648, -7, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 130, -2147483648, -49, -2147483648, -49, -49, -49, -49, -49, -2147483648, -49,
+    -49, -49, -49, -2147483648, -2147483648, -49, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -49, -2147483648, -49, -2147483648, -2147483648, -49, -2147483648, -2147483648, -49, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -46, -2147483648, -46, -46, -46, -46,
+    -46, -2147483648, -46, -46, -46, -46, -2147483648, -2147483648, -46, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -46, -2147483648, -46, -2147483648, -2147483648, -46, -2147483648,
+    -2147483648, -46, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 131, -2147483648,
+    -47, -2147483648, -47, -47, -47, -47, -47, -2147483648, -47, -47, -47, -47,
+    -2147483648, -2147483648, -47, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -47,
+    -2147483648, -47, -2147483648, -2147483648, -47, -2147483648, -2147483648, -47, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -48, -2147483648, -48, -48, -48, -48, -48, -2147483648, -48,
+    -48, -48, -48, -2147483648, -2147483648, -48, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -48, -2147483648, -48, -2147483648, -2147483648, -48, -2147483648, -2147483648, -48, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -24, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 25, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 5, 17, -2147483648,
+    -2147483648, 12, 4, 2, 8, 3, 22, 18, -2147483648, 21, -2147483648, 15,
+    19, 14, 6, 20, -2147483648, 13, 7, 9, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    5, 17, -2147483648, -2147483648, 12, 4, 2, 8, 3, 22, 18, -2147483648,
+    21, -2147483648, 15, 19, 14, 6, 20, -2147483648, 13, 7, 9, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -8, -2147483648, -2147483648, -5, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -5, -5, -2147483648, 134, -5, -5,
+    -5, -5, -5, -5, -5, -2147483648, -5, -2147483648, -5, -5, -5, -5,
+    -5, -2147483648, -5, -5, -5, -2147483648, -2147483648, -5, -5, -2147483648, -9, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -9, -9, -2147483648,
+    -2147483648, -9, -9, -9, -9, -9, -9, -9, -2147483648, -9, -2147483648, -9,
+    -9, -9, -9, -9, -2147483648, -9, -9, -9, -2147483648, -2147483648, -9, -9,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 135, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 136, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 137, -2147483648, -2147483648, -2147483648, -20, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -20, -20, -2147483648,
+    -2147483648, -20, -20, -20, -20, -20, -20, -20, -2147483648, -20, -2147483648, -20,
+    -20, -20, -20, -20, -2147483648, -20, -20, -20, -2147483648, -2147483648, -20, -20,
+    -2147483648, -19, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -19, -19, -2147483648, -2147483648, -19, -19, -19, -19, -19, -19, -19, -2147483648,
+    -19, -2147483648, -19, -19, -19, -19, -19, -2147483648, -19, -19, -19, -2147483648,
+    -2147483648, -19, -19, -2147483648, 25, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, 5, 17, -2147483648, -2147483648, 12, 4, 2, 8, 3,
+    22, 18, -2147483648, 21, -2147483648, 15, 19, 14, 6, 20, -2147483648, 13,
+    7, 9, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 139, -2147483648, -2147483648, -6, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -6, -6, -2147483648,
+    -2147483648, -6, -6, -6, -6, -6, -6, -6, -2147483648, -6, -2147483648, -6,
+    -6, -6, -6, -6, -2147483648, -6, -6, -6, -2147483648, -2147483648, -6, -6,
+])
+
+GOTO = array("i", [
+    -2147483648, -2147483648, -2147483648, -2147483648, 11, 10, 16, 24, 23, 1, -2147483648, -2147483648,
+    -2147483648, -2147483648, 11, 10, -2147483648, 26, 23, 1, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    11, 50, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 11, 54,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 11, 57, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 11, 60, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 11, 62, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    11, 63, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 11, 64,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 67, -2147483648, 11, 66, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 11, 68, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 11, 69, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 11, 70, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    11, 71, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 11, 72,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 11, 73, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 11, 74, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 11, 75, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 11, 76, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    11, 77, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 11, 78,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 11, 79, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 11, 80, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 11, 81, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 11, 83,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 11, 84, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 11, 85, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 11, 91, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    11, 101, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, 103, 105, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 103, 106, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    11, 108, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 11, 109,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 110, -2147483648, 11, 66, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, 11, 112, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 11, 113, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 120, 11, 10, -2147483648, -2147483648, 23, 119,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 123, 11, 10,
+    -2147483648, -2147483648, 23, 119, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 103, 126,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 129, 11, 10, -2147483648, -2147483648, 23, 119,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, 132, 11, 10, -2147483648, -2147483648, 23, 119, -2147483648, -2147483648, -2147483648, 133,
+    11, 10, -2147483648, -2147483648, 23, 119, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, 138, 11, 10, -2147483648, -2147483648, 23, 119,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+    -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648, -2147483648,
+])
+
+DEFAULT_REDUCTIONS = array("i", [
+    0, 0, 0, 0, 0, -12, 0, 0, 0, 0, 0, -50,
+    -51, 0, 0, 0, 0, -13, -52, 0, 0, 0, 0, 0,
+    -1, 0, -3, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, -10, 0, 0, 0,
+    0, 0, 0, 0, 0, -43, 0, 0, 0, 0, 0, 0,
+    -27, 0, 0, 0, -26, 0, 0, 0, 0, 0, -39, 0,
+    0, 0, 0, -4, 0, 0, 0, 0, 0, 0, 0, -42,
+    0, 0, -40, -15, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, -45, 0, 0, 0, -22, 0, -21, 0, 0, 0,
+    0, -49, -46, 0, -47, -48, -24, 0, 0, -8, 0, -9,
+    0, 0, 0, -20, -19, 0, 0, -6,
+])
+
+PROD_LHS = array("i", [
+    0, 6, 7, 7, 5, 9, 9, 3, 3, 9, 9, 8,
+    8, 8, 8, 8, 8, 8, 8, 9, 9, 0, 0, 1,
+    1, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5,
+    5, 5, 5, 8, 8, 5, 5, 5, 2, 2, 5, 5,
+    5, 5, 5, 4, 4,
+])
+
+PROD_LEN = array("i", [
+    1, 1, 1, 2, 3, 7, 11, 1, 2, 7, 2, 1,
+    1, 1, 1, 4, 4, 4, 3, 9, 9, 2, 2, 1,
+    3, 2, 3, 3, 3, 3, 2, 3, 3, 3, 3, 3,
+    3, 3, 3, 3, 4, 1, 4, 3, 1, 3, 6, 6,
+    6, 6, 1, 1, 1,
+])
@@ -0,0 +1,55 @@
+from compiler.errors import LogicError, ImmutableError
+
+
+# Source type names ('int', 'float') to the names used by the checker
+TYPE_NAMES = {'int': 'INT', 'float': 'FLT'}
+
+
+class Symbol:
+    __slots__ = ('name', 'type', 'slot', 'argument', 'assigned')
+
+    def __init__(self, name, typ, slot, argument=False):
+        self.name = name
+        self.type = typ
+        self.slot = slot
+        self.argument = argument
+        self.assigned = False
+
+    @property
+    def in_register(self):
+        """Arguments that are never assigned to need no stack slot"""
+        return self.argument and not self.assigned
+
+
+class FunctionScope:
+    """
+    The variables of one function, in the order they are declared. The
+    semantic pass resolves every identifier to its index in `symbols`, so
+    code generation keeps the pointer of each variable in a list of the same
+    length and never looks a name up. For arguments kept in registers, the
+    list holds the argument itself.
+    """
+    def __init__(self, name, typ=None):
+        self.name = name
+        self.type = typ
+        self.symbols = []
+        self.ptrs = None
+        self.loops = 0
+        self._slots = {}
+
+    def __contains__(self, name):
+        return name in self._slots
+
+    def declare(self, name, typ, argument=False):
+        if name in self._slots:
+            raise ImmutableError(name)
+        symbol = Symbol(name, typ, len(self.symbols), argument)
+        self._slots[name] = symbol.slot
+        self.symbols.append(symbol)
+        return symbol
+
+    def resolve(self, name):
+        slot = self._slots.get(name)
+        if slot is None:
+            raise LogicError("Unknown name: <%s> is not defined in function <%s>" % (name, self.name))
+        return self.symbols[slot]
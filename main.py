@@ -1,59 +1,155 @@
-from compiler.lexer import Lexer
+from compiler.lexer import Lexer, map_source
 from compiler.parser import Parser, ParserState
 from compiler.JSONparsedTree import Node, write
-from compiler.codegen import CodeGen
-from rply.lexer import LexerStream
-from copy import copy
+from compiler.codegen import CodeGen, default_linker, target_cpu
+from compiler.cache import CompileCache
+from rply.token import TokenBuffer
 from pprint import pprint
 import traceback
+import os
+import sys
+import argparse
 import json
 
-input_file = open('input.code').read()
+# Kinds of output and their default file names
+OUTPUTS = {'ir': 'output.ll', 'bc': 'output.bc', 'asm': 'output.s', 'obj': 'output.o', 'exe': 'output'}
+
+arg_parser = argparse.ArgumentParser(description='Compile a program to LLVM IR')
+arg_parser.add_argument('input', nargs='?', default='input.code', help='source file (default: input.code)')
+arg_parser.add_argument('-O', dest='opt_level', type=int, choices=range(4), default=0, metavar='LEVEL', help='optimization level 0-3 (default: 0)')
+arg_parser.add_argument('-mcpu', dest='cpu', default='', metavar='CPU', help="target CPU, 'host' for this machine (default: generic)")
+arg_parser.add_argument('-mattr', dest='features', default='', metavar='FEATURES', help='target features, e.g. +avx2,+fma')
+arg_parser.add_argument('-mcmodel', dest='code_model', choices=['default', 'small', 'kernel', 'medium', 'large'], default='default', help='code model of the emitted assembly and object code (default: default)')
+arg_parser.add_argument('--unroll-count', type=int, metavar='N', help='hint to unroll every loop N times')
+arg_parser.add_argument('--vectorize-width', type=int, metavar='N', help='hint to vectorize every loop N elements wide')
+arg_parser.add_argument('--interleave-count', type=int, metavar='N', help='hint to interleave N iterations of every vectorized loop')
+arg_parser.add_argument('--no-branchless', dest='branchless', action='store_false', help='lower every boolean and/or with branches, even when the right side is cheap')
+arg_parser.add_argument('--emit', choices=OUTPUTS, default='ir', help='write LLVM IR, LLVM bitcode, assembly, an object file or an executable (default: ir)')
+arg_parser.add_argument('-o', dest='output', help='output file (default: output.ll, output.bc, output.s, output.o or output)')
+arg_parser.add_argument('--time', action='store_true', help='print the time spent in each phase')
+arg_parser.add_argument('--run', action='store_true', help='run the compiled program in-process after compiling it')
+arg_parser.add_argument('--mmap', action='store_true', help='lex the source from a memory map instead of reading it')
+arg_parser.add_argument('--tokens', action='store_true', help='print the lexed tokens')
+arg_parser.add_argument('--cache', nargs='?', const='', metavar='DIR', help='reuse the output of an earlier compile of the same source and options, cached in DIR (default: the user cache directory); a hit writes the output without compiling, so no symbol table is printed')
+arg_parser.add_argument('--cache-size', type=int, default=256, metavar='MB', help='size the cache is bounded to (default: 256)')
+arg_parser.add_argument('--table-cache', metavar='DIR', help='directory of cached parser tables')
+arg_parser.add_argument('--tree', action='store_true', help='write the tree for treant-js-master/SemanticAnalyzer.json')
+arg_parser.add_argument('--compact-tree', action='store_true', help='with --tree, write program and block chains as arrays')
+args = arg_parser.parse_args()
+
+if args.mmap:
+    input_file = map_source(args.input)
+else:
+    input_file = open(args.input).read()
+
+
+def write_output(filename, data):
+    with open(filename, 'wb') as f:
+        f.write(data)
+    if args.emit == 'exe':
+        os.chmod(filename, 0o755)
+
+
+def print_cache_stats(result):
+    print('Cache %s (hits: %d, misses: %d, evictions: %d)' % (
+        (result,) + tuple(cache.stats()[name] for name in ('hits', 'misses', 'evictions'))))
+
+
+output = args.output or OUTPUTS[args.emit]
+
+# --run, --tree and --tokens need the compile itself, so they bypass the cache
+cache = cache_key = None
+if args.cache is not None and not (args.run or args.tree or args.tokens):
+    cache = CompileCache(args.cache or None, args.cache_size << 20)
+    cpu, features = target_cpu(args.cpu, args.features)
+    cache_key = cache.key(input_file, emit=args.emit, opt_level=args.opt_level, cpu=cpu, features=features,
+                          code_model=args.code_model, unroll_count=args.unroll_count,
+                          vectorize_width=args.vectorize_width, interleave_count=args.interleave_count,
+                          branchless=args.branchless, linker=default_linker() if args.emit == 'exe' else None)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        write_output(output, cached)
+        print("\n\nCompile log:\nCompile complete without errors")
+        print_cache_stats('hit')
+        sys.exit(0)
+
+codegen = CodeGen(opt_level=args.opt_level, cpu=args.cpu, features=args.features, code_model=args.code_model,
+                  unroll_count=args.unroll_count, vectorize_width=args.vectorize_width,
+                  interleave_count=args.interleave_count)
+module = codegen.module
+builder = codegen.builder
+printf = codegen.printf
 
 lexer = Lexer().build()
-tokens: LexerStream
+tokens = TokenBuffer()
+has_errors = False
 try:
-    tokens = lexer.lex(input_file)
-    tokenType = map(lambda x: x.gettokentype(), copy(tokens))
-    tokenName = map(lambda x: x.getstr(), copy(tokens))
-    pprint(list(copy(tokens)))
+    with codegen.phase('lex'):
+        tokens.extend(lexer.lex(input_file))
+    if args.tokens:
+        pprint(list(tokens))
 except (BaseException, Exception):
     traceback.print_exc()
+    has_errors = True
 finally:
     print("\n\nCompile log:")
 
-codegen = CodeGen()
-module = codegen.module
-builder = codegen.builder
-printf = codegen.printf
-
 SymbolTable = ParserState()
 syntaxRoot: Node
-semanticRoot = Node("main")
-has_errors = False
+semanticRoot = Node("main") if args.tree else None
 try:
-    Parser(module, builder, printf).build().parse(copy(tokens), state=SymbolTable).eval(semanticRoot)
+    with codegen.phase('parse'):
+        tree = Parser(module, builder, printf, cache_dir=args.table_cache, branchless=args.branchless).build().parse(tokens, state=SymbolTable)
+    with codegen.phase('analyze'):
+        tree.analyze(SymbolTable)
+    with codegen.phase('fold'):
+        tree.fold()
+    with codegen.phase('eval'):
+        tree.eval(semanticRoot)
 except (BaseException, Exception) as e:
     # traceback.print_exc()
     print('Error occurred: %s' % e)
     has_errors = True
 finally:
-    write(semanticRoot, "SemanticAnalyzer")
+    if args.tree:
+        write(semanticRoot, "SemanticAnalyzer", compact=args.compact_tree)
 
     codegen.create_ir()
-    codegen.save_ir("output.ll")
+    if args.emit == 'ir':
+        codegen.save_ir(output)
+    elif not has_errors:
+        if args.emit == 'bc':
+            codegen.save_bitcode(output)
+        elif args.emit == 'asm':
+            codegen.emit_assembly(output)
+        elif args.emit == 'obj':
+            codegen.emit_object(output)
+        else:
+            codegen.emit_executable(output)
 
     if not has_errors:
         print('Compile complete without errors')
+        if cache is not None:
+            with open(output, 'rb') as f:
+                cache.put(cache_key, f.read())
+            print_cache_stats('miss')
     else:
         print('Compile complete with errors!')
     print("\n\nSymbol table:\nName\t|\tType\t|\tFunction")
-    for m in SymbolTable.variables.keys():
-        for v in SymbolTable.variables[m].keys():
-            if v != 'args':
-                print('%s\t|\t%s\t|\t%s' % (v, SymbolTable.variables[m][v]['type'], m._name))
+    for scope in SymbolTable.scopes:
+        for symbol in scope.symbols:
+            print('%s\t|\t%s\t|\t%s' % (symbol.name, symbol.type, scope.name))
     for v in SymbolTable.functions.keys():
         print('%s\t|\t%s\t|\t-' % (v, SymbolTable.functions[v].typ))
 
+    if args.run and not has_errors:
+        print("\n\nOutput:")
+        codegen.run()
+
+    if args.time:
+        print("\n\nPhase\t|\tSeconds")
+        for phase, seconds in codegen.timings.items():
+            print('%s\t|\t%.6f' % (phase, seconds))
+
     # with open('treant-js-master/SemanticAnalyzer.json', 'r') as file:
     #     print(json.dumps(json.loads(file.read()), sort_keys=False, indent=4))
@@ -1,11 +1,11 @@
 from rply.errors import LexingError, ParsingError
 from rply.lexergenerator import LexerGenerator
 from rply.parsergenerator import ParserGenerator
-from rply.token import Token
+from rply.token import Token, TokenBuffer
 
 __version__ = '0.7.7'
 
 __all__ = [
     "LexerGenerator", "LexingError", "ParserGenerator", "ParsingError",
-    "Token",
+    "Token", "TokenBuffer",
 ]
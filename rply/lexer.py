@@ -1,3 +1,6 @@
+import mmap
+import re
+
 from rply.errors import LexingError
 from rply.token import SourcePosition, Token
 
@@ -18,27 +21,46 @@ class LexerStream(object):
         self.idx = 0
 
         self._lineno = 1
+        # Offset of the last newline before `idx`, so that columns can be
+        # computed without searching back through the source.
+        self._last_nl = -1
 
     def __iter__(self):
         return self
 
-    def _update_pos(self, match):
-        self.idx = match.end
-        self._lineno += self.s.count("\n", match.start, match.end)
-        last_nl = self.s.rfind("\n", 0, match.start)
-        if last_nl < 0:
-            return match.start + 1
-        else:
-            return match.start - last_nl
+    def _update_pos(self, start, end):
+        self.idx = end
+        colno = start - self._last_nl
+        newlines = self.s.count("\n", start, end)
+        if newlines:
+            self._lineno += newlines
+            self._last_nl = self.s.rfind("\n", start, end)
+        return colno
 
     def next(self):
+        name, start, end, lineno, colno = self.next_span()
+        return Token(
+            name, self.getstr(start, end), SourcePosition(start, lineno, colno)
+        )
+
+    def getstr(self, start, end):
+        """
+        Returns the source text between the offsets `start` and `end`.
+        """
+        return self.s[start:end]
+
+    def next_span(self):
+        """
+        Lexes the next token without creating a :class:`~rply.Token` and
+        returns a tuple of its name, start and end offsets, line and column.
+        """
         while True:
             if self.idx >= len(self.s):
                 raise StopIteration
             for rule in self.lexer.ignore_rules:
                 match = rule.matches(self.s, self.idx)
                 if match:
-                    self._update_pos(match)
+                    self._update_pos(match.start, match.end)
                     break
             else:
                 break
@@ -47,14 +69,187 @@ class LexerStream(object):
             match = rule.matches(self.s, self.idx)
             if match:
                 lineno = self._lineno
-                colno = self._update_pos(match)
-                source_pos = SourcePosition(match.start, lineno, colno)
-                token = Token(
-                    rule.name, self.s[match.start:match.end], source_pos
-                )
-                return token
+                colno = self._update_pos(match.start, match.end)
+                name = rule.name
+                if rule.keywords is not None:
+                    name = rule.keywords.get(
+                        self.getstr(match.start, match.end), name
+                    )
+                return name, match.start, match.end, lineno, colno
         else:
             raise LexingError(None, SourcePosition(self.idx, -1, -1))
 
     def __next__(self):
         return self.next()
+
+
+# Flags that can be applied to a single alternative of the master pattern
+# with an inline ``(?flags:...)`` group.
+_SCOPED_FLAGS = [
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+]
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def compile_master_pattern(rules, ignore_rules):
+    """
+    Compiles `ignore_rules` followed by `rules` into a single regular
+    expression in which every rule is an alternative wrapped in its own named
+    group.
+
+    Returns a tuple of the compiled expression and a list mapping group
+    indices to rules (`None` for ignore rules), or `None` if a rule cannot be
+    combined (named groups, backreferences, or flags that cannot be scoped to
+    a group).
+    """
+    all_rules = ignore_rules + rules
+    alternatives = []
+    for i, rule in enumerate(all_rules):
+        pattern = rule.re.pattern
+        if rule.re.groupindex or _BACKREFERENCE.search(pattern):
+            return None
+        flags = rule.flags & ~re.UNICODE
+        scoped = ""
+        for flag, letter in _SCOPED_FLAGS:
+            if flags & flag:
+                scoped += letter
+                flags &= ~flag
+        if flags:
+            return None
+        if scoped:
+            pattern = "(?%s:%s)" % (scoped, pattern)
+        alternatives.append("(?P<_%d>%s)" % (i, pattern))
+    try:
+        master = re.compile("|".join(alternatives))
+    except re.error:
+        return None
+    groups = [None] * (master.groups + 1)
+    for i, rule in enumerate(rules, len(ignore_rules)):
+        groups[master.groupindex["_%d" % i]] = rule
+    return master, groups
+
+
+class MasterLexer(Lexer):
+    """
+    A lexer that matches all rules with a single regular expression.
+
+    Ignore rules come first in the alternation, followed by the rules in the
+    order they were added, so the first alternative that matches is the one
+    the rule-by-rule :class:`Lexer` would have picked.
+    """
+    def __init__(self, rules, ignore_rules, master, groups):
+        Lexer.__init__(self, rules, ignore_rules)
+        self.master = master
+        self.groups = groups
+        self._master_bytes = None
+
+    @property
+    def master_bytes(self):
+        """
+        The master pattern compiled for bytes input. Character classes such as
+        ``\\w`` and ``\\s`` only match ASCII characters in this form.
+        """
+        if self._master_bytes is None:
+            self._master_bytes = re.compile(
+                self.master.pattern.encode("utf-8"),
+                self.master.flags & ~re.UNICODE
+            )
+        return self._master_bytes
+
+    def lex(self, s):
+        """
+        Returns a stream of tokens in `s`. `s` may also be a bytes-like object
+        such as an :class:`mmap.mmap`, see :class:`BufferLexerStream`.
+        """
+        if isinstance(s, str):
+            return MasterLexerStream(self, s)
+        return BufferLexerStream(self, s)
+
+
+class MasterLexerStream(LexerStream):
+    def next_span(self):
+        s = self.s
+        match = self.lexer.master.match
+        groups = self.lexer.groups
+        while True:
+            if self.idx >= len(s):
+                raise StopIteration
+            m = match(s, self.idx)
+            if m is None:
+                raise LexingError(None, SourcePosition(self.idx, -1, -1))
+            rule = groups[m.lastindex]
+            start, end = m.span()
+            if rule is not None:
+                break
+            self._update_pos(start, end)
+
+        lineno = self._lineno
+        colno = self._update_pos(start, end)
+        name = rule.name
+        if rule.keywords is not None:
+            name = rule.keywords.get(s[start:end], name)
+        return name, start, end, lineno, colno
+
+
+class BufferLexerStream(LexerStream):
+    """
+    Lexes UTF-8 encoded bytes, usually a read-only :class:`mmap.mmap` of the
+    source file. Only the text of each token is decoded, and pages of a memory
+    map are handed back to the OS every `window` bytes once the stream has
+    moved past them, so memory use does not grow with the size of the input.
+
+    Source positions are byte offsets.
+    """
+    def __init__(self, lexer, s, window=16 * mmap.PAGESIZE):
+        LexerStream.__init__(self, lexer, s)
+        self.window = window
+        self._released = 0
+        self._can_release = (
+            isinstance(s, mmap.mmap) and hasattr(mmap, "MADV_DONTNEED")
+        )
+
+    def _update_pos(self, start, end):
+        self.idx = end
+        colno = start - self._last_nl
+        nl = self.s.find(b"\n", start, end)
+        while nl >= 0:
+            self._lineno += 1
+            self._last_nl = nl
+            nl = self.s.find(b"\n", nl + 1, end)
+        return colno
+
+    def _release(self):
+        end = self.idx - self.idx % mmap.PAGESIZE
+        self.s.madvise(mmap.MADV_DONTNEED, self._released, end - self._released)
+        self._released = end
+
+    def getstr(self, start, end):
+        return self.s[start:end].decode("utf-8")
+
+    def next_span(self):
+        s = self.s
+        match = self.lexer.master_bytes.match
+        groups = self.lexer.groups
+        if self._can_release and self.idx - self._released >= self.window:
+            self._release()
+        while True:
+            if self.idx >= len(s):
+                raise StopIteration
+            m = match(s, self.idx)
+            if m is None:
+                raise LexingError(None, SourcePosition(self.idx, -1, -1))
+            rule = groups[m.lastindex]
+            start, end = m.span()
+            if rule is not None:
+                break
+            self._update_pos(start, end)
+
+        lineno = self._lineno
+        colno = self._update_pos(start, end)
+        name = rule.name
+        if rule.keywords is not None:
+            name = rule.keywords.get(self.getstr(start, end), name)
+        return name, start, end, lineno, colno
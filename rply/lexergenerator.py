@@ -11,17 +11,18 @@ except ImportError:
     def we_are_translated():
         return False
 
-from rply.lexer import Lexer
+from rply.lexer import Lexer, MasterLexer, compile_master_pattern
 
 
 class Rule(object):
-    _attrs_ = ['name', 'flags', '_pattern']
+    _attrs_ = ['name', 'flags', 'keywords', '_pattern']
 
-    def __init__(self, name, pattern, flags=0):
+    def __init__(self, name, pattern, flags=0, keywords=None):
         self.name = name
+        self.keywords = keywords
         self.re = re.compile(pattern, flags=flags)
+        self.flags = flags
         if rpython:
-            self.flags = flags
             self._pattern = get_code(pattern, flags)
 
     def _freeze_(self):
@@ -91,12 +92,18 @@ class LexerGenerator(object):
         self.rules = []
         self.ignore_rules = []
 
-    def add(self, name, pattern, flags=0):
+    def add(self, name, pattern, flags=0, keywords=None):
         """
         Adds a rule with the given `name` and `pattern`. In case of ambiguity,
         the first rule added wins.
+
+        `keywords` may map matched strings to other token names. A match found
+        in it produces a token of that name instead of `name`, which lets a
+        single identifier rule recognize reserved words::
+
+            lg.add('IDENTIFIER', r'[a-z]+', keywords={'if': 'IF'})
         """
-        self.rules.append(Rule(name, pattern, flags=flags))
+        self.rules.append(Rule(name, pattern, flags=flags, keywords=keywords))
 
     def ignore(self, pattern, flags=0):
         """
@@ -105,10 +112,19 @@ class LexerGenerator(object):
         """
         self.ignore_rules.append(Rule("", pattern, flags=flags))
 
-    def build(self):
+    def build(self, master=False):
         """
         Returns a lexer instance, which provides a `lex` method that must be
         called with a string and returns an iterator yielding
         :class:`~rply.Token` instances.
+
+        If `master` is true, all rules are compiled into one regular
+        expression and every token is produced by a single match (see
+        :class:`~rply.lexer.MasterLexer`). Rules that cannot be combined make
+        the generator fall back to the rule-by-rule lexer.
         """
+        if master and not rpython:
+            compiled = compile_master_pattern(self.rules, self.ignore_rules)
+            if compiled is not None:
+                return MasterLexer(self.rules, self.ignore_rules, *compiled)
         return Lexer(self.rules, self.ignore_rules)
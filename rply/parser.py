@@ -1,4 +1,7 @@
+from array import array
+
 from rply.errors import ParsingError
+from rply.utils import iteritems
 
 
 class LRParser(object):
@@ -9,6 +12,7 @@ class LRParser(object):
     def parse(self, tokenizer, state=None):
         from rply.token import Token
 
+        tokenizer = iter(tokenizer)
         lookahead = None
         lookaheadstack = []
 
@@ -83,3 +87,154 @@ class LRParser(object):
         current_state = self.lr_table.lr_goto[statestack[-1]][pname]
         statestack.append(current_state)
         return current_state
+
+
+# Marks a missing entry in the action and goto tables of DenseLRParser.
+ERROR = -0x80000000
+
+
+class DenseLRParser(LRParser):
+    """
+    An :class:`LRParser` that interns terminals and nonterminals to small
+    integers and keeps the action and goto tables in flat arrays, indexed by
+    ``state * number_of_symbols + symbol``.
+
+    When parsing a :class:`~rply.token.TokenBuffer`, its type ids are mapped
+    to terminal ids once, so the loop never looks at token names.
+    """
+    def __init__(self, terminals, nonterminals, action, goto,
+                 default_reductions, prod_lhs, prod_len, prod_func,
+                 error_handler, lr_table=None):
+        LRParser.__init__(self, lr_table, error_handler)
+        self.terminals = terminals
+        self.term_ids = dict((t, i) for i, t in enumerate(terminals))
+        self.nonterminals = nonterminals
+        self.action = action
+        self.goto = goto
+        self.default_reductions = default_reductions
+        self.prod_lhs = prod_lhs
+        self.prod_len = prod_len
+        self.prod_func = prod_func
+
+    @classmethod
+    def from_table(cls, lr_table, error_handler):
+        grammar = lr_table.grammar
+        terminals = sorted(grammar.terminals) + ["$end"]
+        term_ids = dict((t, i) for i, t in enumerate(terminals))
+        nonterminals = sorted(grammar.nonterminals)
+        nonterm_ids = dict((n, i) for i, n in enumerate(nonterminals))
+
+        nterms = len(terminals)
+        nnonterms = len(nonterminals)
+        nstates = len(lr_table.lr_action)
+        action = array("i", [ERROR]) * (nstates * nterms)
+        goto = array("i", [ERROR]) * (nstates * nnonterms)
+        for st in range(nstates):
+            for t, a in iteritems(lr_table.lr_action[st]):
+                action[st * nterms + term_ids[t]] = a
+            for n, j in iteritems(lr_table.lr_goto[st]):
+                goto[st * nnonterms + nonterm_ids[n]] = j
+
+        productions = grammar.productions
+        return cls(
+            terminals,
+            nonterminals,
+            action,
+            goto,
+            array("i", lr_table.default_reductions),
+            array("i", [nonterm_ids.get(p.name, 0) for p in productions]),
+            array("i", [p.getlength() for p in productions]),
+            [p.func for p in productions],
+            error_handler,
+            lr_table=lr_table,
+        )
+
+    def parse(self, tokenizer, state=None):
+        from rply.token import BufferedToken, Token, TokenBuffer
+
+        # Indexing a list is cheaper than indexing an array, which boxes
+        # every item it returns, so the loop works on list copies.
+        action = self.action.tolist()
+        goto = self.goto.tolist()
+        default_reductions = self.default_reductions.tolist()
+        prod_lhs = self.prod_lhs.tolist()
+        prod_len = self.prod_len.tolist()
+        prod_func = self.prod_func
+        nterms = len(self.terminals)
+        nnonterms = len(self.nonterminals)
+        term_ids = self.term_ids
+        end = term_ids["$end"]
+
+        if isinstance(tokenizer, TokenBuffer):
+            buffer = tokenizer
+            type_map = [term_ids.get(n, ERROR) for n in buffer.names]
+            types = buffer.types
+            ntokens = len(types)
+        else:
+            buffer = None
+            tokens = iter(tokenizer)
+        pos = 0
+
+        lookahead = None
+        ltype = None
+
+        statestack = [0]
+        symstack = [Token("$end", "$end")]
+
+        current_state = 0
+        while True:
+            t = default_reductions[current_state]
+            if not t:
+                if ltype is None:
+                    if buffer is not None:
+                        ltype = type_map[types[pos]] if pos < ntokens else end
+                    else:
+                        lookahead = next(tokens, None)
+                        if lookahead is None:
+                            lookahead = Token("$end", "$end")
+                        ltype = term_ids.get(lookahead.gettokentype(), ERROR)
+
+                if ltype != ERROR:
+                    t = action[current_state * nterms + ltype]
+                else:
+                    t = ERROR
+                if t > 0:
+                    statestack.append(t)
+                    current_state = t
+                    if buffer is not None:
+                        symstack.append(BufferedToken(buffer, pos))
+                        pos += 1
+                    else:
+                        symstack.append(lookahead)
+                        lookahead = None
+                    ltype = None
+                    continue
+                elif t == 0:
+                    return symstack[-1]
+                elif t == ERROR:
+                    if buffer is not None:
+                        if pos < ntokens:
+                            lookahead = buffer[pos]
+                        else:
+                            lookahead = Token("$end", "$end")
+                    if self.error_handler is not None:
+                        if state is None:
+                            self.error_handler(lookahead)
+                        else:
+                            self.error_handler(state, lookahead)
+                        raise AssertionError("For now, error_handler must raise.")
+                    else:
+                        raise ParsingError(None, lookahead.getsourcepos())
+
+            # reduce a symbol on the stack and emit a production
+            start = len(symstack) - prod_len[-t]
+            targ = symstack[start:]
+            del symstack[start:]
+            del statestack[start:]
+            if state is None:
+                value = prod_func[-t](targ)
+            else:
+                value = prod_func[-t](state, targ)
+            symstack.append(value)
+            current_state = goto[statestack[-1] * nnonterms + prod_lhs[-t]]
+            statestack.append(current_state)
@@ -1,6 +1,6 @@
-import errno
 import hashlib
 import json
+import marshal
 import os
 import sys
 import tempfile
@@ -10,8 +10,8 @@ from appdirs import AppDirs
 
 from rply.errors import ParserGeneratorError, ParserGeneratorWarning
 from rply.grammar import Grammar
-from rply.parser import LRParser
-from rply.utils import Counter, IdentityDict, iteritems, itervalues
+from rply.parser import DenseLRParser, LRParser
+from rply.utils import Counter, iteritems, itervalues
 
 
 LARGE_VALUE = sys.maxsize
@@ -30,14 +30,17 @@ class ParserGenerator(object):
                        token names with the same associativity and level of
                        precedence.
     :param cache_id: A string specifying an ID for caching.
+    :param cache_dir: The directory holding cached tables. Defaults to the
+                      user's cache directory for rply.
     """
-    VERSION = 1
+    VERSION = 2
 
-    def __init__(self, tokens, precedence=[], cache_id=None):
+    def __init__(self, tokens, precedence=[], cache_id=None, cache_dir=None):
         self.tokens = tokens
         self.productions = []
         self.precedence = precedence
         self.cache_id = cache_id
+        self.cache_dir = cache_dir
         self.error_handler = None
 
     def production(self, rule, precedence=None):
@@ -130,7 +133,7 @@ class ParserGenerator(object):
         if sorted(g.precedence) != sorted(data["precedence"]):
             return False
         for key, (assoc, level) in iteritems(g.precedence):
-            if data["precedence"][key] != [assoc, level]:
+            if tuple(data["precedence"][key]) != (assoc, level):
                 return False
         if len(g.productions) != len(data["productions"]):
             return False
@@ -143,7 +146,7 @@ class ParserGenerator(object):
                 return False
         return True
 
-    def build(self):
+    def _make_grammar(self):
         g = Grammar(self.tokens)
 
         for level, (assoc, terms) in enumerate(self.precedence, 1):
@@ -154,6 +157,20 @@ class ParserGenerator(object):
             g.add_production(prod_name, syms, func, precedence)
 
         g.set_start()
+        return g
+
+    def build(self, dense=False, tables=None):
+        """
+        Builds the parse tables and returns a parser. If `dense` is true, the
+        parser is a :class:`~rply.parser.DenseLRParser` working on integer
+        tables instead of dictionaries keyed by symbol names.
+
+        `tables` may be a module written by :meth:`write_tables`. If it was
+        generated from this grammar, a :class:`~rply.parser.DenseLRParser`
+        using its tables is returned without building anything. Otherwise a
+        warning is issued and the tables are built as usual.
+        """
+        g = self._make_grammar()
 
         for unused_term in g.unused_terminals():
             warnings.warn(
@@ -168,26 +185,48 @@ class ParserGenerator(object):
                 stacklevel=2
             )
 
-        g.build_lritems()
-        g.compute_first()
-        g.compute_follow()
+        if tables is not None:
+            if (getattr(tables, "VERSION", None) == self.VERSION and
+                    tables.GRAMMAR_HASH == self.compute_grammar_hash(g)):
+                return DenseLRParser(
+                    list(tables.TERMINALS),
+                    list(tables.NONTERMINALS),
+                    tables.ACTION,
+                    tables.GOTO,
+                    tables.DEFAULT_REDUCTIONS,
+                    tables.PROD_LHS,
+                    tables.PROD_LEN,
+                    [p.func for p in g.productions],
+                    self.error_handler,
+                )
+            warnings.warn(
+                "Parse tables in %s do not match the grammar" % (
+                    getattr(tables, "__name__", type(tables).__name__)
+                ),
+                ParserGeneratorWarning,
+                stacklevel=2
+            )
+            dense = True
 
         table = None
         if self.cache_id is not None:
-            cache_dir = AppDirs("rply").user_cache_dir
+            cache_dir = self.cache_dir
+            if cache_dir is None:
+                cache_dir = AppDirs("rply").user_cache_dir
             cache_file = os.path.join(
                 cache_dir,
-                "%s-%s-%s.json" % (
+                "%s-%s-%s.marshal" % (
                     self.cache_id, self.VERSION, self.compute_grammar_hash(g)
                 )
             )
 
-            if os.path.exists(cache_file):
-                with open(cache_file) as f:
-                    data = json.load(f)
-                if self.data_is_valid(g, data):
-                    table = LRTable.from_cache(g, data)
+            data = self._read_cache(cache_file)
+            if data is not None and self.data_is_valid(g, data):
+                table = LRTable.from_cache(g, data)
         if table is None:
+            g.build_lritems()
+            g.compute_first()
+            g.compute_follow()
             table = LRTable.from_grammar(g)
 
             if self.cache_id is not None:
@@ -211,54 +250,128 @@ class ParserGenerator(object):
                 ParserGeneratorWarning,
                 stacklevel=2,
             )
+        if dense:
+            return DenseLRParser.from_table(table, self.error_handler)
         return LRParser(table, self.error_handler)
 
+    def write_tables(self, filename):
+        """
+        Writes a Python module containing the dense parse tables of this
+        grammar to `filename`. Importing it and passing it to :meth:`build`
+        as `tables` skips table construction. The module records a hash of
+        the grammar, so tables that have gone stale are detected.
+        """
+        g = self._make_grammar()
+        parser = self.build(dense=True)
+        lines = [
+            "# Parse tables generated by rply from the grammar below. Do not",
+            "# edit; regenerate them with ParserGenerator.write_tables().",
+            "from array import array",
+            "",
+            "VERSION = %d" % self.VERSION,
+            "GRAMMAR_HASH = %r" % self.compute_grammar_hash(g),
+            "",
+            "TERMINALS = %r" % (parser.terminals,),
+            "NONTERMINALS = %r" % (parser.nonterminals,),
+            "",
+            "# Production number -> (left-hand side, right-hand side). Reducing",
+            "# production n calls the n-th function registered with",
+            "# ParserGenerator.production(); number 0 is the start production.",
+            "PRODUCTIONS = [",
+        ]
+        for p in g.productions:
+            lines.append("    (%r, %r)," % (p.name, p.prod))
+        lines.append("]")
+        for name in ["ACTION", "GOTO", "DEFAULT_REDUCTIONS", "PROD_LHS",
+                     "PROD_LEN"]:
+            values = getattr(parser, name.lower()).tolist()
+            lines.append("")
+            lines.append("%s = array(\"i\", [" % name)
+            for i in range(0, len(values), 12):
+                lines.append(
+                    "    " + ", ".join(str(v) for v in values[i:i + 12]) + ","
+                )
+            lines.append("])")
+        with open(filename, "w") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def _read_cache(self, cache_file):
+        try:
+            with open(cache_file, "rb") as f:
+                return marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
     def _write_cache(self, cache_dir, cache_file, table):
-        if not os.path.exists(cache_dir):
-            try:
+        # The cache is only an optimization. A directory that cannot be
+        # written to is used read-only: the table is built but not saved.
+        # The table goes to a dot-file first and is renamed into place, so
+        # a partial table is never read; on failure the dot-file is removed.
+        f = None
+        try:
+            if not os.path.exists(cache_dir):
                 os.makedirs(cache_dir, mode=0o0700)
-            except OSError as e:
-                if e.errno == errno.EROFS:
-                    return
-                raise
-
-        with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False, mode="w") as f:
-            json.dump(self.serialize_table(table), f)
-        os.rename(f.name, cache_file)
+            with tempfile.NamedTemporaryFile(
+                dir=cache_dir, prefix=".", delete=False
+            ) as f:
+                marshal.dump(self.serialize_table(table), f)
+            os.replace(f.name, cache_file)
+        except (OSError, ValueError):
+            if f is not None:
+                try:
+                    os.remove(f.name)
+                except OSError:
+                    pass
 
 
 def digraph(X, R, FP):
+    """
+    Computes F(x) = FP(x) | union of F(y) for all y reachable from x through
+    the relation R, for every x in X. Sets are bitsets (ints); the strongly
+    connected components of R share one value.
+    """
     N = dict.fromkeys(X, 0)
     stack = []
     F = {}
     for x in X:
         if N[x] == 0:
-            traverse(x, N, stack, F, X, R, FP)
+            traverse(x, N, stack, F, R, FP)
     return F
 
 
-def traverse(x, N, stack, F, X, R, FP):
+def traverse(x, N, stack, F, R, FP):
+    # An iterative version of DeRemer and Pennello's recursive traversal, so
+    # that long chains of relations cannot exhaust the recursion limit. Each
+    # entry of `work` is a node, its depth on `stack`, and an iterator over
+    # the successors not visited yet.
     stack.append(x)
-    d = len(stack)
-    N[x] = d
+    N[x] = len(stack)
     F[x] = FP(x)
-
-    rel = R(x)
-    for y in rel:
-        if N[y] == 0:
-            traverse(y, N, stack, F, X, R, FP)
-        N[x] = min(N[x], N[y])
-        for a in F.get(y, []):
-            if a not in F[x]:
-                F[x].append(a)
-    if N[x] == d:
-        N[stack[-1]] = LARGE_VALUE
-        F[stack[-1]] = F[x]
-        element = stack.pop()
-        while element != x:
-            N[stack[-1]] = LARGE_VALUE
-            F[stack[-1]] = F[x]
-            element = stack.pop()
+    work = [(x, N[x], iter(R(x)))]
+    while work:
+        v, d, successors = work[-1]
+        for y in successors:
+            if N[y] == 0:
+                stack.append(y)
+                N[y] = len(stack)
+                F[y] = FP(y)
+                work.append((y, N[y], iter(R(y))))
+                break
+            N[v] = min(N[v], N[y])
+            F[v] |= F[y]
+        else:
+            work.pop()
+            if N[v] == d:
+                while True:
+                    element = stack.pop()
+                    N[element] = LARGE_VALUE
+                    F[element] = F[v]
+                    if element == v:
+                        break
+            if work:
+                parent = work[-1][0]
+                N[parent] = min(N[parent], N[v])
+                F[parent] |= F[v]
 
 
 class LRTable(object):
@@ -292,12 +405,9 @@ class LRTable(object):
 
     @classmethod
     def from_grammar(cls, grammar):
-        cidhash = IdentityDict()
-        goto_cache = {}
-        add_count = Counter()
-        C = cls.lr0_items(grammar, add_count, cidhash, goto_cache)
+        C, goto = cls.lr0_items(grammar)
 
-        cls.add_lalr_lookaheads(grammar, C, add_count, cidhash, goto_cache)
+        cls.add_lalr_lookaheads(grammar, C, goto)
 
         lr_action = [None] * len(C)
         lr_goto = [None] * len(C)
@@ -352,8 +462,7 @@ class LRTable(object):
                     i = p.lr_index
                     a = p.prod[i + 1]
                     if a in grammar.terminals:
-                        g = cls.lr0_goto(I, a, add_count, goto_cache)
-                        j = cidhash.get(g, -1)
+                        j = goto[st].get(a, -1)
                         if j >= 0:
                             if a in st_action:
                                 r = st_action[a]
@@ -377,15 +486,8 @@ class LRTable(object):
                             else:
                                 st_action[a] = j
                                 st_actionp[a] = p
-            nkeys = set()
-            for ii in I:
-                for s in ii.unique_syms:
-                    if s in grammar.nonterminals:
-                        nkeys.add(s)
-            for n in nkeys:
-                g = cls.lr0_goto(I, n, add_count, goto_cache)
-                j = cidhash.get(g, -1)
-                if j >= 0:
+            for n, j in iteritems(goto[st]):
+                if n in grammar.nonterminals:
                     st_goto[n] = j
 
             lr_action[st] = st_action
@@ -399,28 +501,38 @@ class LRTable(object):
         return LRTable(grammar, lr_action, lr_goto, default_reductions, sr_conflicts, rr_conflicts)
 
     @classmethod
-    def lr0_items(cls, grammar, add_count, cidhash, goto_cache):
-        C = [cls.lr0_closure([grammar.productions[0].lr_next], add_count)]
-        for i, I in enumerate(C):
-            cidhash[I] = i
+    def lr0_items(cls, grammar):
+        """
+        Builds the canonical collection of LR(0) item sets. Returns the item
+        sets and, for every set, a dict mapping each symbol to the index of
+        the set reached by a transition on it.
+        """
+        add_count = Counter()
+        start = grammar.productions[0].lr_next
+        C = [cls.lr0_closure([start], add_count)]
+        kernels = {frozenset([start]): 0}
+        goto = []
 
         i = 0
         while i < len(C):
             I = C[i]
             i += 1
 
-            asyms = set()
-            for ii in I:
-                asyms.update(ii.unique_syms)
-            for x in asyms:
-                g = cls.lr0_goto(I, x, add_count, goto_cache)
-                if not g:
-                    continue
-                if g in cidhash:
-                    continue
-                cidhash[g] = len(C)
-                C.append(g)
-        return C
+            successors = {}
+            for p in I:
+                n = p.lr_next
+                if n is not None:
+                    successors.setdefault(n.lr_before, []).append(n)
+            transitions = {}
+            for x, kernel in iteritems(successors):
+                key = frozenset(kernel)
+                j = kernels.get(key)
+                if j is None:
+                    j = kernels[key] = len(C)
+                    C.append(cls.lr0_closure(kernel, add_count))
+                transitions[x] = j
+            goto.append(transitions)
+        return C, goto
 
     @classmethod
     def lr0_closure(cls, I, add_count):
@@ -440,36 +552,17 @@ class LRTable(object):
         return J
 
     @classmethod
-    def lr0_goto(cls, I, x, add_count, goto_cache):
-        s = goto_cache.setdefault(x, IdentityDict())
-
-        gs = []
-        for p in I:
-            n = p.lr_next
-            if n and n.lr_before == x:
-                s1 = s.get(n)
-                if not s1:
-                    s1 = {}
-                    s[n] = s1
-                gs.append(n)
-                s = s1
-        g = s.get("$end")
-        if not g:
-            if gs:
-                g = cls.lr0_closure(gs, add_count)
-                s["$end"] = g
-            else:
-                s["$end"] = gs
-        return g
+    def add_lalr_lookaheads(cls, grammar, C, goto):
+        # Lookahead sets are bitsets over the terminals in this order.
+        terminals = sorted(grammar.terminals) + ["$end"]
+        term_bits = dict((t, 1 << i) for i, t in enumerate(terminals))
 
-    @classmethod
-    def add_lalr_lookaheads(cls, grammar, C, add_count, cidhash, goto_cache):
         nullable = cls.compute_nullable_nonterminals(grammar)
-        trans = cls.find_nonterminal_transitions(grammar, C)
-        readsets = cls.compute_read_sets(grammar, C, trans, nullable, add_count, cidhash, goto_cache)
-        lookd, included = cls.compute_lookback_includes(grammar, C, trans, nullable, add_count, cidhash, goto_cache)
+        trans = cls.find_nonterminal_transitions(grammar, goto)
+        readsets = cls.compute_read_sets(grammar, C, goto, trans, nullable, term_bits)
+        lookd, included = cls.compute_lookback_includes(grammar, C, goto, trans, nullable)
         followsets = cls.compute_follow_sets(trans, readsets, included)
-        cls.add_lookaheads(lookd, followsets)
+        cls.add_lookaheads(lookd, followsets, terminals)
 
     @classmethod
     def compute_nullable_nonterminals(cls, grammar):
@@ -491,22 +584,20 @@ class LRTable(object):
         return nullable
 
     @classmethod
-    def find_nonterminal_transitions(cls, grammar, C):
+    def find_nonterminal_transitions(cls, grammar, goto):
         trans = []
-        for idx, state in enumerate(C):
-            for p in state:
-                if p.lr_index < p.getlength() - 1:
-                    t = (idx, p.prod[p.lr_index + 1])
-                    if t[1] in grammar.nonterminals and t not in trans:
-                        trans.append(t)
+        for idx, transitions in enumerate(goto):
+            for x in transitions:
+                if x in grammar.nonterminals:
+                    trans.append((idx, x))
         return trans
 
     @classmethod
-    def compute_read_sets(cls, grammar, C, ntrans, nullable, add_count, cidhash, goto_cache):
+    def compute_read_sets(cls, grammar, C, goto, ntrans, nullable, term_bits):
         return digraph(
             ntrans,
-            R=lambda x: cls.reads_relation(C, x, nullable, add_count, cidhash, goto_cache),
-            FP=lambda x: cls.dr_relation(grammar, C, x, nullable, add_count, goto_cache)
+            R=lambda x: cls.reads_relation(C, goto, x, nullable),
+            FP=lambda x: cls.dr_relation(grammar, C, goto, x, term_bits)
         )
 
     @classmethod
@@ -518,28 +609,26 @@ class LRTable(object):
         )
 
     @classmethod
-    def dr_relation(cls, grammar, C, trans, nullable, add_count, goto_cache):
+    def dr_relation(cls, grammar, C, goto, trans, term_bits):
         state, N = trans
-        terms = []
+        terms = 0
 
-        g = cls.lr0_goto(C[state], N, add_count, goto_cache)
-        for p in g:
+        for p in C[goto[state][N]]:
             if p.lr_index < p.getlength() - 1:
                 a = p.prod[p.lr_index + 1]
-                if a in grammar.terminals and a not in terms:
-                    terms.append(a)
+                if a in grammar.terminals:
+                    terms |= term_bits[a]
         if state == 0 and N == grammar.productions[0].prod[0]:
-            terms.append("$end")
+            terms |= term_bits["$end"]
         return terms
 
     @classmethod
-    def reads_relation(cls, C, trans, empty, add_count, cidhash, goto_cache):
+    def reads_relation(cls, C, goto, trans, empty):
         rel = []
         state, N = trans
 
-        g = cls.lr0_goto(C[state], N, add_count, goto_cache)
-        j = cidhash.get(g, -1)
-        for p in g:
+        j = goto[state][N]
+        for p in C[j]:
             if p.lr_index < p.getlength() - 1:
                 a = p.prod[p.lr_index + 1]
                 if a in empty:
@@ -547,11 +636,11 @@ class LRTable(object):
         return rel
 
     @classmethod
-    def compute_lookback_includes(cls, grammar, C, trans, nullable, add_count, cidhash, goto_cache):
+    def compute_lookback_includes(cls, grammar, C, goto, trans, nullable):
         lookdict = {}
         includedict = {}
 
-        dtrans = dict.fromkeys(trans, 1)
+        dtrans = set(trans)
 
         for state, N in trans:
             lookb = []
@@ -577,8 +666,7 @@ class LRTable(object):
                         else:
                             includes.append((j, t))
 
-                    g = cls.lr0_goto(C[j], t, add_count, goto_cache)
-                    j = cidhash.get(g, -1)
+                    j = goto[j][t]
 
                 for r in C[j]:
                     if r.name != p.name:
@@ -599,11 +687,14 @@ class LRTable(object):
         return lookdict, includedict
 
     @classmethod
-    def add_lookaheads(cls, lookbacks, followset):
+    def add_lookaheads(cls, lookbacks, followset, terminals):
+        laheads = {}
         for trans, lb in iteritems(lookbacks):
+            f = followset.get(trans, 0)
             for state, p in lb:
-                f = followset.get(trans, [])
-                laheads = p.lookaheads.setdefault(state, [])
-                for a in f:
-                    if a not in laheads:
-                        laheads.append(a)
+                key = state, p
+                laheads[key] = laheads.get(key, 0) | f
+        for (state, p), bits in iteritems(laheads):
+            p.lookaheads[state] = [
+                t for i, t in enumerate(terminals) if bits >> i & 1
+            ]
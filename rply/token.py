@@ -1,3 +1,6 @@
+from array import array
+
+
 class BaseBox(object):
     """
     A base class for polymorphic boxes that wrap parser results. Simply use
@@ -6,6 +9,7 @@ class BaseBox(object):
     to always return objects of the same type.
     """
     _attrs_ = []
+    __slots__ = ()
 
 
 class Token(BaseBox):
@@ -18,6 +22,8 @@ class Token(BaseBox):
                        position of the first character in the source from which
                        this token was generated.
     """
+    __slots__ = ("name", "value", "source_pos")
+
     def __init__(self, name, value, source_pos=None):
         self.name = name
         self.value = value
@@ -62,6 +68,8 @@ class SourcePosition(object):
     The values passed to this object can be retrieved using the identically
     named attributes.
     """
+    __slots__ = ("idx", "lineno", "colno")
+
     def __init__(self, idx, lineno, colno):
         self.idx = idx
         self.lineno = lineno
@@ -71,3 +79,107 @@ class SourcePosition(object):
         return "SourcePosition(idx={0}, lineno={1}, colno={2})".format(
             self.idx, self.lineno, self.colno
         )
+
+
+class TokenBuffer(object):
+    """
+    Stores the tokens of a source, so that it is lexed only once however many
+    times the tokens are iterated over. Each iteration starts at the first
+    token, which makes a buffer usable wherever a token stream is expected.
+
+    Tokens are kept as columns of integers: a type id, the start and end
+    offsets, the line and the column. Indexing or iterating the buffer returns
+    :class:`BufferedToken` views, whose text is only sliced from the source
+    when :meth:`~Token.getstr` is called.
+
+    :param stream: A stream returned by a lexer.
+    """
+    def __init__(self, stream=None):
+        self.stream = None
+        self.names = []
+        self._type_ids = {}
+        self.types = array("i")
+        self.starts = array("q")
+        self.ends = array("q")
+        self.lines = array("i")
+        self.cols = array("i")
+        if stream is not None:
+            self.extend(stream)
+
+    def extend(self, stream):
+        """
+        Lexes the rest of `stream` into the buffer. If lexing fails halfway
+        through, the tokens lexed up to that point are kept.
+        """
+        if self.stream is None:
+            self.stream = stream
+        elif stream.s is not self.stream.s:
+            raise ValueError("All tokens of a buffer must come from one source")
+        next_span = stream.next_span
+        type_ids = self._type_ids
+        types, starts, ends = self.types, self.starts, self.ends
+        lines, cols = self.lines, self.cols
+        while True:
+            try:
+                name, start, end, lineno, colno = next_span()
+            except StopIteration:
+                break
+            type_id = type_ids.get(name)
+            if type_id is None:
+                type_id = type_ids[name] = len(self.names)
+                self.names.append(name)
+            types.append(type_id)
+            starts.append(start)
+            ends.append(end)
+            lines.append(lineno)
+            cols.append(colno)
+
+    def gettokentype(self, idx):
+        return self.names[self.types[idx]]
+
+    def getsourcepos(self, idx):
+        return SourcePosition(self.starts[idx], self.lines[idx], self.cols[idx])
+
+    def getstr(self, idx):
+        return self.stream.getstr(self.starts[idx], self.ends[idx])
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += len(self.types)
+        if not 0 <= idx < len(self.types):
+            raise IndexError("token index out of range")
+        return BufferedToken(self, idx)
+
+    def __iter__(self):
+        for idx in range(len(self.types)):
+            yield BufferedToken(self, idx)
+
+    def __repr__(self):
+        return "TokenBuffer(%d tokens)" % len(self.types)
+
+
+class BufferedToken(Token):
+    """
+    A :class:`Token` that reads its type, position and text from a
+    :class:`TokenBuffer` on demand.
+    """
+    __slots__ = ("buffer", "idx")
+
+    def __init__(self, buffer, idx):
+        self.buffer = buffer
+        self.idx = idx
+
+    @property
+    def name(self):
+        return self.buffer.gettokentype(self.idx)
+
+    @property
+    def value(self):
+        return self.buffer.getstr(self.idx)
+
+    @property
+    def source_pos(self):
+        return self.buffer.getsourcepos(self.idx)